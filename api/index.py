@@ -1,12 +1,25 @@
-from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
+from starlette.datastructures import MutableHeaders
+from typing import Dict, List, Optional
 from shannon.link_budget import LinkBudget
-from shannon.orbits import PassPredictor
+from shannon.orbits import ConstellationPredictor, PassPredictor
 from shannon.ground_station import GroundStation
 from shannon.modulation import Modulation
+from shannon.cache import EPHEMERIS_CACHE
+from shannon import instrumentation
+from shannon.instrumentation import span
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import contextvars
 import datetime
+import functools
+import io
+import os
+import threading
+import time
 import numpy as np
 
 app = FastAPI()
@@ -31,6 +44,11 @@ class LinkBudgetRequest(BaseModel):
     data_rate: float
     required_eb_no: float
 
+class LinkBudgetBatchRequest(BaseModel):
+    # Either a list of requests, or columnar arrays keyed by LinkBudgetRequest field
+    requests: Optional[List[LinkBudgetRequest]] = None
+    columns: Optional[Dict[str, List[float]]] = None
+
 class PassPredictionRequest(BaseModel):
     tle_line1: str
     tle_line2: str
@@ -39,13 +57,227 @@ class PassPredictionRequest(BaseModel):
     alt: float
     max_duration_hours: float = 24.0
 
+class PassPredictionBatchRequest(BaseModel):
+    requests: List[PassPredictionRequest]
+
+class PassScheduleRequest(BaseModel):
+    tle_line1: str
+    tle_line2: str
+    lat: float
+    lon: float
+    alt: float
+    duration_hours: float = 24.0
+
 class IQRequest(BaseModel):
     scheme: str
     snr_db: float
     num_symbols: int = 1000
 
+class IQStreamRequest(BaseModel):
+    scheme: str
+    snr_db: float
+    num_symbols: int = 1000
+    block_symbols: int = 65536
+    dtype: str = "float32"  # "float32" or "float64", always little-endian
+    framed: bool = False
+
+# Binary columnar pass payload (Accept: application/octet-stream), all little-endian:
+#   header  magic b"SHNP", uint16 version, uint16 reserved, uint32 pass count, uint32 reserved
+#   per pass: float64 AOS and LOS (Unix seconds), float64 step (s), float32 max_el, uint32 n,
+#             then float32 az[n], el[n], range_km[n]; point i is at AOS + i * step
+# Accept: application/x-npy returns the same fields as a stream of .npy arrays instead:
+# per pass, a float64 [aos, los, step, max_el] array followed by a float32 (3, n) array.
+_PASS_MAGIC = b"SHNP"
+_PASS_FORMAT_VERSION = 1
+_PASS_FILE_HEADER = np.dtype([("magic", "S4"), ("version", "<u2"), ("reserved", "<u2"),
+                              ("count", "<u4"), ("reserved2", "<u4")])
+_PASS_RECORD_HEADER = np.dtype([("aos", "<f8"), ("los", "<f8"), ("step", "<f8"),
+                                ("max_el", "<f4"), ("n", "<u4")])
+_PASS_BINARY_TYPE = "application/octet-stream"
+_PASS_NPY_TYPE = "application/x-npy"
+
+# Fields of a link budget batch, in LinkBudgetRequest order
+_LINK_BUDGET_FIELDS = list(LinkBudgetRequest.model_fields)
+
+# Wire dtypes of the IQ stream: explicit little-endian regardless of the host
+_IQ_DTYPES = {"float32": np.dtype("<f4"), "float64": np.dtype("<f8")}
+
+class _ComputePool:
+    """
+    Bounded executor for the CPU-bound handlers (SGP4, NumPy), kept apart from the
+    server's default threadpool so a burst of pass searches cannot starve cheap calls.
+
+    max_workers: jobs running at once (request-level concurrency limit)
+    max_queued: jobs allowed to wait for a worker; beyond that requests get a 429
+    timeout: seconds a request waits for its result before a 504
+
+    A job that times out while running cannot be interrupted; it keeps its slot
+    until it finishes, so the pool never runs more than max_workers jobs.
+    """
+
+    def __init__(self, max_workers, max_queued, timeout):
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.timeout = timeout
+        self.pending = 0  # running + queued jobs and open streams
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="shannon-compute")
+
+    async def run(self, fn, *args, **kwargs):
+        self._acquire()
+        future = self._submit(functools.partial(fn, *args, **kwargs))
+        # Release the slot when the job really finishes (or is cancelled while queued).
+        # The callback runs on whichever thread completes the future, so it must not
+        # depend on the event loop, which may be closed by then.
+        future.add_done_callback(self._release)
+        return await self._wait(future)
+
+    async def stream(self, next_chunk):
+        """
+        Async iterator over next_chunk() results, each computed on the pool, until
+        it returns None. The stream holds one slot from this call until it ends, so
+        the 429 applies when it opens; the first chunk is computed before returning,
+        so errors in it (and a 504) surface before a response starts.
+        """
+        self._acquire()
+        stream = _PoolStream(self, next_chunk)
+        try:
+            stream._first = await stream._compute()
+        except BaseException:
+            stream.close()
+            raise
+        return stream
+
+    def _acquire(self):
+        with self._lock:
+            if self.pending >= self.max_workers + self.max_queued:
+                raise HTTPException(status_code=429, detail="Server busy, retry later",
+                                    headers={"Retry-After": "1"})
+            self.pending += 1
+
+    def _release(self, _future=None):
+        with self._lock:
+            self.pending -= 1
+
+    def _submit(self, fn):
+        # Run in a copy of the request's context so instrumentation spans reach its timings
+        context = contextvars.copy_context()
+        return self._executor.submit(context.run, fn)
+
+    async def _wait(self, future):
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            future.cancel()
+            raise HTTPException(status_code=504, detail="Request timed out") from None
+
+
+_NOT_FETCHED = object()
+
+
+class _PoolStream:
+    """Chunks of a _ComputePool.stream(); releases its slot once, when it ends."""
+
+    def __init__(self, pool, next_chunk):
+        self._pool = pool
+        self._next_chunk = next_chunk
+        self._first = _NOT_FETCHED
+        self._future = None  # chunk being computed, if any
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._closed:
+            raise StopAsyncIteration
+        chunk, self._first = self._first, _NOT_FETCHED
+        try:
+            if chunk is _NOT_FETCHED:
+                chunk = await self._compute()
+        except BaseException:
+            # Timeout, error or client disconnect
+            self.close()
+            raise
+        if chunk is None:
+            self.close()
+            raise StopAsyncIteration
+        return chunk
+
+    async def _compute(self):
+        self._future = self._pool._submit(self._next_chunk)
+        chunk = await self._pool._wait(self._future)
+        self._future = None
+        return chunk
+
+    async def aclose(self):
+        self.close()
+
+    def close(self):
+        """Ends the stream. Its slot is released once no chunk is being computed."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        future = self._future
+        if future is None:
+            self._pool._release()
+        else:
+            # Called at once if the chunk has already finished
+            future.add_done_callback(self._pool._release)
+
+    def __del__(self):
+        # A stream whose response was never sent still gives its slot back
+        self.close()
+
+
+COMPUTE_POOL = _ComputePool(
+    max_workers=int(os.environ.get("SHANNON_COMPUTE_WORKERS", os.cpu_count() or 1)),
+    max_queued=int(os.environ.get("SHANNON_COMPUTE_QUEUE", 32)),
+    timeout=float(os.environ.get("SHANNON_REQUEST_TIMEOUT", 30.0)),
+)
+
+class _ServerTimingMiddleware:
+    """
+    Adds a Server-Timing header with the per-stage totals of each request.
+    A plain ASGI middleware: instrumentation is opt-in (SHANNON_INSTRUMENTATION=1),
+    and while it is disabled requests, streaming bodies included, pass straight through.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not instrumentation.is_enabled():
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        with instrumentation.collect() as timings:
+            async def send_with_timing(message):
+                if message["type"] == "http.response.start":
+                    total = time.perf_counter() - start
+                    instrumentation.REGISTRY.histogram("request").observe(total)
+                    timings["total"] = total
+                    MutableHeaders(scope=message).append(
+                        "Server-Timing", instrumentation.server_timing(timings)
+                    )
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
+
+app.add_middleware(_ServerTimingMiddleware)
+
+@app.get("/api/metrics")
+def metrics():
+    """Per-stage timing histograms in the Prometheus text format (empty while instrumentation is off)."""
+    return PlainTextResponse(instrumentation.render_prometheus(), media_type="text/plain; version=0.0.4")
+
 @app.post("/api/calculate-link-budget")
-def calculate_link_budget(req: LinkBudgetRequest):
+async def calculate_link_budget(req: LinkBudgetRequest):
+    # A single budget is a few dozen float operations: computing it inline on the
+    # event loop is cheaper than any thread hop, and keeps its latency flat under load.
     link = LinkBudget(req.frequency, req.distance_km)
     link.set_transmitter(req.tx_power_dbm, req.tx_cable_loss, req.tx_antenna_gain)
     link.add_path_loss(req.atmosphere_loss)
@@ -58,36 +290,218 @@ def calculate_link_budget(req: LinkBudgetRequest):
         "losses": link.losses
     }
 
+@app.post("/api/calculate-link-budget/batch")
+async def calculate_link_budget_batch(req: LinkBudgetBatchRequest):
+    return await COMPUTE_POOL.run(_calculate_link_budget_batch, req)
+
+def _calculate_link_budget_batch(req):
+    """
+    Evaluates every budget in one vectorized LinkBudget.evaluate call.
+    Results are returned in request order; a margin of -inf (data_rate <= 0) is null.
+    """
+    if (req.requests is None) == (req.columns is None):
+        return JSONResponse(content={"error": "Provide exactly one of requests or columns"}, status_code=400)
+
+    if req.requests is not None:
+        columns = {
+            field: np.array([getattr(r, field) for r in req.requests], dtype=np.float64)
+            for field in _LINK_BUDGET_FIELDS
+        }
+    else:
+        missing = [field for field in _LINK_BUDGET_FIELDS if field not in req.columns]
+        if missing:
+            return JSONResponse(content={"error": f"Missing columns: {', '.join(missing)}"}, status_code=400)
+        columns = {field: np.asarray(req.columns[field], dtype=np.float64) for field in _LINK_BUDGET_FIELDS}
+        if len({len(c) for c in columns.values()}) > 1:
+            return JSONResponse(content={"error": "All columns must have the same length"}, status_code=400)
+
+    link = LinkBudget(2.4e9, 0.0)
+    result = link.evaluate(
+        distance_km=columns["distance_km"], frequency=columns["frequency"],
+        data_rate=columns["data_rate"], required_eb_no=columns["required_eb_no"],
+        atmosphere_loss=columns["atmosphere_loss"], tx_power_dbm=columns["tx_power_dbm"],
+        tx_cable_loss=columns["tx_cable_loss"], tx_antenna_gain=columns["tx_antenna_gain"],
+        rx_antenna_gain=columns["rx_antenna_gain"], rx_noise_temp=columns["rx_noise_temp"],
+    )
+
+    margin = result["margin_db"]
+    finite = np.isfinite(margin).tolist()
+    # Same loss breakdown as the single endpoint, built column-wise
+    losses = zip(
+        columns["tx_power_dbm"].tolist(), (-columns["tx_cable_loss"]).tolist(),
+        columns["tx_antenna_gain"].tolist(), (-result["fspl_db"]).tolist(),
+        (-columns["atmosphere_loss"]).tolist(), columns["rx_antenna_gain"].tolist(),
+    )
+    return JSONResponse(content={"results": [
+        {
+            "margin_db": m if ok else None,
+            "losses": [
+                ["Tx Power", tx], ["Cable Loss", cable], ["Tx Antenna Gain", tx_gain],
+                ["FSPL", fspl], ["Atmosphere Loss", atm], ["Rx Antenna Gain", rx_gain],
+            ],
+        }
+        for m, ok, (tx, cable, tx_gain, fspl, atm, rx_gain) in zip(margin.tolist(), finite, losses)
+    ]})
+
+def _utcnow():
+    """Start time of the pass searches (a separate function so tests can pin it)."""
+    return datetime.datetime.utcnow()
+
 @app.post("/api/predict-pass")
-def predict_pass(req: PassPredictionRequest):
-    predictor = PassPredictor(req.tle_line1, req.tle_line2)
+async def predict_pass(req: PassPredictionRequest, request: Request):
+    return await COMPUTE_POOL.run(_predict_pass, req, _negotiate_pass_format(request))
+
+def _predict_pass(req, media_type):
+    # Repeated requests for popular TLEs reuse the parsed Satrec and the
+    # propagated coarse ephemeris from the process-wide cache.
+    predictor = PassPredictor(req.tle_line1, req.tle_line2, ephemeris_cache=EPHEMERIS_CACHE)
     station = GroundStation(req.lat, req.lon, req.alt)
 
     # We need to handle time. For now, assume "now".
-    start_time = datetime.datetime.utcnow()
-    pass_data = predictor.get_next_pass(station, start_time, req.max_duration_hours)
+    start_time = _utcnow()
+    with span("pass_search"):
+        pass_data = predictor.get_next_pass(station, start_time, req.max_duration_hours)
 
-    if pass_data:
-        # Optimization: Bypassing FastAPI's default serialization via Pydantic model (`jsonable_encoder`)
-        # by returning a custom `JSONResponse` directly avoids evaluating `isinstance` on every element
-        # of the long list, running over 5x faster than the default framework serialization loop.
-        response_data = {
-            "aos": pass_data.aos.isoformat(),
-            "los": pass_data.los.isoformat(),
-            "max_el": pass_data.max_el,
-            "points": [{
-                "time": p['time'].isoformat(),
-                "az": p['az'],
-                "el": p['el'],
-                "range_km": p['range_km']
-            } for p in pass_data.points]
-        }
-        return JSONResponse(content=response_data)
+    with span("serialize"):
+        if media_type is not None:
+            # No pass is an empty (zero pass) payload
+            return _passes_response([pass_data] if pass_data else [], media_type)
+
+        if pass_data:
+            # Optimization: Bypassing FastAPI's default serialization via Pydantic model (`jsonable_encoder`)
+            # by returning a custom `JSONResponse` directly avoids evaluating `isinstance` on every element
+            # of the long list, running over 5x faster than the default framework serialization loop.
+            return JSONResponse(content=_pass_to_dict(pass_data))
+        else:
+            return JSONResponse(content={"message": "No pass found within duration."})
+
+@app.post("/api/predict-passes")
+async def predict_passes(req: PassScheduleRequest, request: Request):
+    return await COMPUTE_POOL.run(_predict_passes, req, _negotiate_pass_format(request))
+
+def _predict_passes(req, media_type):
+    # Repeated requests for popular TLEs reuse the parsed Satrec and the
+    # propagated coarse ephemeris from the process-wide cache.
+    predictor = PassPredictor(req.tle_line1, req.tle_line2, ephemeris_cache=EPHEMERIS_CACHE)
+    station = GroundStation(req.lat, req.lon, req.alt)
+
+    start_time = _utcnow()
+    end_time = start_time + datetime.timedelta(hours=req.duration_hours)
+    with span("pass_search"):
+        passes = predictor.get_passes(station, start_time, end_time)
+
+    with span("serialize"):
+        if media_type is not None:
+            return _passes_response(passes, media_type)
+
+        return JSONResponse(content={"passes": [_pass_to_dict(p) for p in passes]})
+
+@app.post("/api/predict-pass/batch")
+async def predict_pass_batch(req: PassPredictionBatchRequest):
+    return await COMPUTE_POOL.run(_predict_pass_batch, req)
+
+def _predict_pass_batch(req):
+    """
+    Next pass for every request, in request order, as /api/predict-pass returns it.
+    Requests for the same ground station share one ConstellationPredictor scan on
+    the cached coarse ephemeris: their look angles are computed together.
+    """
+    start_time = _utcnow()
+    results = [None] * len(req.requests)
+
+    groups = {}
+    for i, r in enumerate(req.requests):
+        groups.setdefault((r.lat, r.lon, r.alt), []).append(i)
+
+    for (lat, lon, alt), indices in groups.items():
+        station = GroundStation(lat, lon, alt)
+        predictor = ConstellationPredictor(
+            [(req.requests[i].tle_line1, req.requests[i].tle_line2) for i in indices],
+            ephemeris_cache=EPHEMERIS_CACHE
+        )
+        next_passes = predictor.get_next_passes(
+            station, start_time, [req.requests[i].max_duration_hours for i in indices]
+        )
+
+        for i, next_pass in zip(indices, next_passes):
+            results[i] = (
+                _pass_to_dict(next_pass) if next_pass is not None
+                else {"message": "No pass found within duration."}
+            )
+
+    return JSONResponse(content={"results": results})
+
+def _pass_to_dict(pass_data):
+    # Optimization: serialize straight from the PassData columns. Timestamps are
+    # formatted in one vectorized np.datetime_as_string call instead of one
+    # datetime.isoformat() per point, and `.tolist()` avoids NumPy scalar extraction.
+    return {
+        "aos": pass_data.aos.isoformat(),
+        "los": pass_data.los.isoformat(),
+        "max_el": float(pass_data.max_el),
+        "points": [{
+            "time": t,
+            "az": a,
+            "el": e,
+            "range_km": r
+        } for t, a, e, r in zip(
+            np.datetime_as_string(pass_data.times).tolist(),
+            pass_data.az.tolist(),
+            pass_data.el.tolist(),
+            pass_data.range_km.tolist()
+        )]
+    }
+
+def _negotiate_pass_format(request):
+    """The binary media type the client accepts, or None for JSON."""
+    accept = request.headers.get("accept", "")
+    if _PASS_NPY_TYPE in accept:
+        return _PASS_NPY_TYPE
+    if _PASS_BINARY_TYPE in accept:
+        return _PASS_BINARY_TYPE
+    return None
+
+def _pass_columns(pass_data):
+    """Header fields and the packed float32 (3, n) az/el/range block of a pass."""
+    n = len(pass_data)
+    step = float(pass_data.offsets[1] - pass_data.offsets[0]) if n > 1 else 0.0
+    columns = np.empty((3, n), dtype="<f4")
+    columns[0] = pass_data.az
+    columns[1] = pass_data.el
+    columns[2] = pass_data.range_km
+    aos = pass_data.aos.replace(tzinfo=datetime.timezone.utc).timestamp()
+    los = pass_data.los.replace(tzinfo=datetime.timezone.utc).timestamp()
+    return aos, los, step, float(pass_data.max_el), columns
+
+def _passes_response(passes, media_type):
+    # Optimization: the columns are cast to float32 once and written as raw buffers,
+    # so serialization is a handful of memcpys instead of per-point JSON encoding.
+    parts = []
+    if media_type == _PASS_NPY_TYPE:
+        for p in passes:
+            aos, los, step, max_el, columns = _pass_columns(p)
+            buffer = io.BytesIO()
+            np.save(buffer, np.array([aos, los, step, max_el], dtype="<f8"))
+            np.save(buffer, columns)
+            parts.append(buffer.getvalue())
     else:
-        return JSONResponse(content={"message": "No pass found within duration."})
+        header = np.zeros(1, dtype=_PASS_FILE_HEADER)
+        header["magic"] = _PASS_MAGIC
+        header["version"] = _PASS_FORMAT_VERSION
+        header["count"] = len(passes)
+        parts.append(header.tobytes())
+        for p in passes:
+            aos, los, step, max_el, columns = _pass_columns(p)
+            record = np.array([(aos, los, step, max_el, columns.shape[1])], dtype=_PASS_RECORD_HEADER)
+            parts.append(record.tobytes())
+            parts.append(columns.tobytes())
+    return Response(content=b"".join(parts), media_type=media_type)
 
 @app.post("/api/generate-iq")
-def generate_iq(req: IQRequest):
+async def generate_iq(req: IQRequest):
+    return await COMPUTE_POOL.run(_generate_iq, req)
+
+def _generate_iq(req):
     mod = Modulation(req.scheme)
     try:
         symbols = mod.generate_iq(req.num_symbols, req.snr_db)
@@ -101,3 +515,48 @@ def generate_iq(req: IQRequest):
         return JSONResponse(content={"iq_data": iq_data})
     except ValueError as e:
         return JSONResponse(content={"error": str(e)}, status_code=400)
+
+@app.post("/api/generate-iq/stream")
+async def generate_iq_stream(req: IQStreamRequest):
+    """
+    Streams IQ samples as a chunked application/octet-stream of interleaved
+    I, Q values in little-endian float32 or float64. With framed=true every
+    block is preceded by its symbol count as a little-endian uint32.
+    Blocks are generated on the compute pool, and the stream holds one of its
+    slots until it ends.
+    """
+    dtype = _IQ_DTYPES.get(req.dtype)
+    if dtype is None:
+        return JSONResponse(content={"error": f"Unsupported dtype: {req.dtype}"}, status_code=400)
+    if req.num_symbols <= 0 or req.block_symbols <= 0:
+        return JSONResponse(content={"error": "num_symbols and block_symbols must be positive"}, status_code=400)
+
+    mod = Modulation(req.scheme)
+    blocks = mod.iter_iq(req.num_symbols, req.snr_db, req.block_symbols)
+
+    def next_frame():
+        # Optimization: blocks are generated lazily and encoded straight from the
+        # float64 view, so memory stays at one block however many symbols are requested.
+        # float64 on a little-endian host is a zero-copy view; float32 is one cast.
+        block = next(blocks, None)
+        if block is None:
+            return None
+        payload = block.view(np.float64).astype(dtype, copy=False).tobytes()
+        if req.framed:
+            return np.uint32(len(block)).astype("<u4").tobytes() + payload
+        return payload
+
+    try:
+        frames = await COMPUTE_POOL.stream(next_frame)
+    except ValueError as e:
+        return JSONResponse(content={"error": str(e)}, status_code=400)
+
+    return StreamingResponse(
+        frames,
+        media_type="application/octet-stream",
+        headers={
+            "X-IQ-Dtype": dtype.str,
+            "X-IQ-Symbols": str(req.num_symbols),
+            "X-IQ-Framed": "1" if req.framed else "0",
+        },
+    )
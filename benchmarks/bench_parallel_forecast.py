@@ -0,0 +1,92 @@
+"""
+Scaling benchmark for shannon.forecast.forecast_passes.
+
+Runs the same multi-satellite, multi-station forecast with an increasing number
+of worker processes and reports wall time, speedup and parallel efficiency.
+
+Usage:
+    python -m benchmarks.bench_parallel_forecast [--days 7] [--satellites 16]
+
+Also run by the benchmark suite: python -m benchmarks.run_benchmarks --parallel
+"""
+import argparse
+import datetime
+import os
+import time
+from shannon.forecast import forecast_passes
+
+# Sample LEO TLEs; the catalog is built by cycling through them
+TLES = [
+    ("1 25544U 98067A   23345.67890123  .00012345  00000-0  12345-3 0  9999",
+     "2 25544  51.6416 123.4567 0001234 123.4567 321.4567 15.54321098123456"),
+    ("1 33591U 09005A   20265.56828552  .00000055  00000-0  57632-4 0  9995",
+     "2 33591  99.1989 123.6338 0013952 147.2885 212.9238 14.12351659595519"),
+]
+
+STATIONS = [
+    (59.3498, 18.0707, 10),     # KTH, Stockholm
+    (37.7749, -122.4194, 0),    # San Francisco
+    (-33.8688, 151.2093, 50),   # Sydney
+    (78.2232, 15.6267, 400),    # Svalbard
+]
+
+
+def run_scaling(days=7.0, satellites=16, window_hours=24.0, chunk_size=4, worker_counts=None):
+    """
+    Runs the forecast once per worker count.
+    Returns a list of {"workers", "seconds", "speedup", "efficiency"} dicts.
+    """
+    tles = [TLES[i % len(TLES)] for i in range(satellites)]
+    start_time = datetime.datetime(2023, 12, 12, 12, 0, 0)
+    end_time = start_time + datetime.timedelta(days=days)
+
+    if worker_counts is None:
+        cpu_count = os.cpu_count() or 1
+        worker_counts = sorted({1, 2, 4, 8, 16, cpu_count} & set(range(1, cpu_count + 1)))
+
+    rows = []
+    baseline = None
+    reference = None
+    for workers in worker_counts:
+        t0 = time.perf_counter()
+        results = forecast_passes(
+            tles, STATIONS, start_time, end_time, max_workers=workers,
+            window_hours=window_hours, chunk_size=chunk_size
+        )
+        elapsed = time.perf_counter() - t0
+
+        # Merged results must not depend on the number of workers
+        aos = [[[p.aos for p in passes] for passes in sat] for sat in results]
+        if reference is None:
+            reference = aos
+        assert aos == reference, "Parallel forecast differs from the serial one"
+
+        if baseline is None:
+            baseline = elapsed
+        speedup = baseline / elapsed
+        rows.append({
+            "workers": workers,
+            "seconds": elapsed,
+            "speedup": speedup,
+            "efficiency": speedup / workers,
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--days", type=float, default=7.0)
+    parser.add_argument("--satellites", type=int, default=16)
+    parser.add_argument("--window-hours", type=float, default=24.0)
+    parser.add_argument("--chunk-size", type=int, default=4)
+    args = parser.parse_args()
+
+    print(f"{args.satellites} satellites x {len(STATIONS)} stations x {args.days:g} days, {os.cpu_count() or 1} CPUs")
+    print(f"{'workers':>8} {'time (s)':>10} {'speedup':>8} {'efficiency':>11}")
+
+    for row in run_scaling(args.days, args.satellites, args.window_hours, args.chunk_size):
+        print(f"{row['workers']:>8} {row['seconds']:>10.3f} {row['speedup']:>8.2f} {row['efficiency']:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+Micro-benchmark suite for the pass prediction, link budget and modulation hot paths.
+
+Times every case, writes the results as JSON and compares them with a stored
+baseline: a case slower than its baseline by more than --threshold fails the run
+(exit status 1). Each run also times a fixed NumPy reference kernel and cases are
+compared as multiples of it, so a faster or slower machine shifts every case and
+the reference alike. The ratios still depend on the CPU and NumPy build; after
+changing either, regenerate the baseline with --save-baseline.
+
+Usage:
+    python -m benchmarks.run_benchmarks [--output results.json] [--baseline benchmarks/baseline.json]
+                                        [--threshold 2.0] [--save-baseline] [--quick] [--parallel]
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import time
+import numpy as np
+from shannon.ground_station import GroundStation
+from shannon.link_budget import calculate_fspl
+from shannon.modulation import Modulation
+from shannon.orbits import PassPredictor
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# One TLE per orbit regime: (name, tle_line1, tle_line2)
+ORBITS = [
+    ("LEO",
+     "1 25544U 98067A   23345.67890123  .00012345  00000-0  12345-3 0  9999",
+     "2 25544  51.6416 123.4567 0001234 123.4567 321.4567 15.54321098123456"),
+    ("MEO",
+     "1 24876U 97035A   23345.50000000  .00000000  00000-0  00000-0 0  9990",
+     "2 24876  55.5000 100.0000 0050000  50.0000 310.0000  2.00560000190000"),
+    ("GEO",
+     "1 41866U 16071A   23345.50000000 -.00000100  00000-0  00000-0 0  9990",
+     "2 41866   0.0500 100.0000 0001000  50.0000 310.0000  1.00270000 25000"),
+]
+
+WINDOW_HOURS = [6, 24]
+
+START_TIME = datetime.datetime(2023, 12, 12, 12, 0, 0)
+# Every orbit above has a pass from here in each window, so no case times an empty search
+STATION = GroundStation(37.7749, -122.4194, 0)  # San Francisco
+
+
+def reference_kernel(_x=np.linspace(0.0, 10.0, 100_000)):
+    """Fixed workload in the suite's mix (ufuncs, reductions, Python calls)."""
+    y = np.sin(_x) * np.cos(_x) + np.sqrt(_x)
+    np.arctan2(y, _x + 1.0)
+    return sum(float(v) for v in y[:2000])
+
+
+def time_case(fn, repeat, min_seconds=0.05):
+    """
+    Seconds per call of fn(): the minimum over `repeat` runs of a loop sized so
+    each run lasts at least min_seconds, as timeit does.
+    """
+    fn()  # warm up caches and lazy imports
+    loops = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_seconds or loops >= 1 << 20:
+            break
+        loops *= 2
+
+    runs = [elapsed / loops]
+    for _ in range(repeat - 1):
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        runs.append((time.perf_counter() - t0) / loops)
+    return {"seconds": min(runs), "mean": sum(runs) / len(runs), "loops": loops, "repeat": repeat}
+
+
+def build_cases():
+    """Returns {name: zero-argument callable}."""
+    cases = {}
+
+    # Pass search for each orbit regime and window length
+    for name, line1, line2 in ORBITS:
+        predictor = PassPredictor(line1, line2)
+        for hours in WINDOW_HOURS:
+            if predictor._compute_pass_in_window(STATION, START_TIME, hours, 30) is None:
+                raise ValueError(f"{name} has no pass in {hours} h from the benchmark station")
+            cases[f"pass_window/{name}/{hours}h"] = (
+                lambda p=predictor, h=hours: p._compute_pass_in_window(STATION, START_TIME, h, 30)
+            )
+
+    # Dense (1 s) pass points, SGP4 at every point vs. Chebyshev interpolation
+    for label, tolerance in (("sgp4", None), ("chebyshev", 1e-3)):
+        predictor = PassPredictor(ORBITS[0][1], ORBITS[0][2], interpolation_tolerance_km=tolerance)
+        cases[f"pass_points/LEO/24h_1s/{label}"] = (
+            lambda p=predictor: p.get_passes(STATION, START_TIME, START_TIME + datetime.timedelta(hours=24), 1)
+        )
+
+    # Look angles and GMST on one day of 1 minute samples
+    leo = PassPredictor(ORBITS[0][1], ORBITS[0][2])
+    jd, fr = leo.get_julian_date(START_TIME)
+    offsets = np.arange(1440, dtype=np.float64) * 60.0
+    _, r, _ = leo._propagate(jd, fr, offsets)
+    fr_arr = fr + offsets / 86400.0
+    times = [START_TIME + datetime.timedelta(seconds=s) for s in offsets.tolist()]
+
+    cases["look_angles/masked/1440"] = lambda: STATION.compute_look_angles(r, None, jd=jd, fr=fr_arr, mask_invisible=True)
+    cases["look_angles/legacy/1440"] = lambda: STATION.compute_look_angles(r, None, jd=jd, fr=fr_arr, mask_invisible=False)
+    cases["gmst/jd_fr/1440"] = lambda: GroundStation._calculate_gmst(None, jd, fr_arr)
+    cases["gmst/datetimes/1440"] = lambda: GroundStation._calculate_gmst(times)
+
+    # Link budget
+    distances = np.linspace(500e3, 3000e3, 1000)
+    cases["fspl/scalar"] = lambda: calculate_fspl(2.4e9, 600e3)
+    cases["fspl/array/1000"] = lambda: calculate_fspl(2.4e9, distances)
+
+    # Modulation
+    eb_no = np.linspace(-5.0, 15.0, 1000).tolist()
+    bpsk = Modulation("BPSK")
+    cases["ber_formula/scalar/1000"] = lambda: [bpsk.ber_formula(x) for x in eb_no]
+    cases["ber_curves/3x1000"] = lambda: Modulation.ber_curves(["BPSK", "QPSK", "16-QAM"], eb_no)
+    for scheme in ("BPSK", "QPSK", "16-QAM"):
+        mod = Modulation(scheme, seed=0)
+        cases[f"generate_iq/{scheme}/100000"] = lambda m=mod: m.generate_iq(100_000, 10.0)
+
+    return cases
+
+
+def compare(results, baseline, threshold):
+    """
+    Returns a list of (name, seconds, baseline seconds, ratio) for the regressed cases,
+    the ratio being between the times relative to each run's reference kernel.
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None or "relative" not in reference:
+            continue
+        ratio = result["relative"] / reference["relative"]
+        if ratio > threshold:
+            regressions.append((name, result["seconds"], reference["seconds"], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--threshold", type=float, default=2.0,
+                        help="fail when a case takes more than threshold x its baseline time")
+    parser.add_argument("--save-baseline", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--quick", action="store_true", help="fewer repeats, for smoke runs")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this")
+    parser.add_argument("--parallel", action="store_true", help="also run the forecast scaling benchmark")
+    args = parser.parse_args(argv)
+
+    repeat = 2 if args.quick else 5
+    cases = {name: fn for name, fn in build_cases().items() if args.filter in name}
+
+    reference = time_case(reference_kernel, repeat)
+    results = {}
+    print(f"{'case':<32} {'time':>12} {'x reference':>12}")
+    for name, fn in cases.items():
+        results[name] = time_case(fn, repeat)
+        results[name]["relative"] = results[name]["seconds"] / reference["seconds"]
+        print(f"{name:<32} {results[name]['seconds'] * 1e3:>9.3f} ms {results[name]['relative']:>12.3f}")
+
+    report = {
+        "meta": {
+            "timestamp": datetime.datetime.utcnow().isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "reference": reference,
+        "results": results,
+    }
+
+    if args.parallel:
+        from benchmarks.bench_parallel_forecast import run_scaling
+        report["parallel_forecast"] = run_scaling(days=1.0 if args.quick else 7.0)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+
+    regressions = compare(results, baseline, args.threshold)
+    for name, seconds, reference, ratio in regressions:
+        print(f"REGRESSION {name}: {seconds * 1e3:.3f} ms vs {reference * 1e3:.3f} ms baseline "
+              f"({ratio:.2f}x relative to the reference kernel)")
+    if regressions:
+        return 1
+    print(f"No regressions beyond {args.threshold:g}x the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -103,3 +103,61 @@ function drawSkyplot(points) {
         .style("font-size", "10px")
         .style("fill", "var(--error)");
 }
+
+// Decodes the binary columnar pass payload returned by /api/predict-pass and
+// /api/predict-passes for "Accept: application/octet-stream" (see api/index.py).
+// Returns [{aos, los, max_el, step, az, el, range_km, points}], where az/el/range_km
+// are Float32Array views straight into the payload (no copy) and points is the
+// [{time, az, el, range_km}] list drawSkyplot() expects.
+function decodePassBinary(buffer) {
+    const view = new DataView(buffer);
+    const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+    if (magic !== 'SHNP') {
+        throw new Error('Unrecognized pass payload');
+    }
+    const version = view.getUint16(4, true);
+    if (version !== 1) {
+        throw new Error(`Unsupported pass payload version: ${version}`);
+    }
+
+    const count = view.getUint32(8, true);
+    const passes = [];
+    let offset = 16;
+    for (let p = 0; p < count; p++) {
+        const aos = view.getFloat64(offset, true);
+        const los = view.getFloat64(offset + 8, true);
+        const step = view.getFloat64(offset + 16, true);
+        const maxEl = view.getFloat32(offset + 24, true);
+        const n = view.getUint32(offset + 28, true);
+        offset += 32;
+
+        // Headers are 32 bytes and columns 4n, so every column is 4-byte aligned.
+        // Typed arrays use host byte order, which is little-endian on every supported browser.
+        const az = new Float32Array(buffer, offset, n);
+        const el = new Float32Array(buffer, offset + 4 * n, n);
+        const range = new Float32Array(buffer, offset + 8 * n, n);
+        offset += 12 * n;
+
+        const points = new Array(n);
+        for (let i = 0; i < n; i++) {
+            points[i] = {
+                time: new Date((aos + i * step) * 1000).toISOString(),
+                az: az[i],
+                el: el[i],
+                range_km: range[i]
+            };
+        }
+
+        passes.push({
+            aos: new Date(aos * 1000).toISOString(),
+            los: new Date(los * 1000).toISOString(),
+            max_el: maxEl,
+            step: step,
+            az: az,
+            el: el,
+            range_km: range,
+            points: points
+        });
+    }
+    return passes;
+}
@@ -1,6 +1,6 @@
 from .link_budget import LinkBudget
-from .orbits import PassPredictor
-from .ground_station import GroundStation
+from .orbits import PassPredictor, ConstellationPredictor
+from .ground_station import GroundStation, GroundStationNetwork
 from .modulation import Modulation
 
 class Mission:
@@ -36,6 +36,18 @@ class Mission:
         self.link_budget.add_path_loss(atmosphere_loss=0.5)
         self.link_budget.set_receiver(antenna_gain=15, noise_temp=150)
 
+    def next_pass_link_analysis(self, data_rate, required_eb_no, threshold_db=3.0):
+        """
+        Link budget of the next pass evaluated along its actual slant range and
+        elevation (see LinkBudget.evaluate_pass). Returns None if no pass is found.
+        """
+        pass_data = self.predictor.get_next_pass(self.ground_station)
+        if pass_data:
+            return self.link_budget.evaluate_pass(
+                pass_data, data_rate, required_eb_no, threshold_db=threshold_db
+            )
+        return None
+
     def next_pass_duration(self):
         # Calculate next pass duration
         pass_data = self.predictor.get_next_pass(self.ground_station)
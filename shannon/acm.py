@@ -0,0 +1,120 @@
+import math
+import numpy as np
+from shannon.modulation import BITS_PER_SYMBOL, Modulation
+
+# 10*log10(x) = ln(x) * 10/ln(10)
+_LOG10_FACTOR_10 = 10.0 / math.log(10)
+
+
+class ACMPlanner:
+    """
+    Adaptive coding and modulation planner. At each sample of a pass it picks the
+    highest-throughput scheme whose required Eb/N0 (for target_ber, plus margin_db)
+    is met at the instantaneous C/N0, and integrates the bits delivered.
+
+    link_budget: LinkBudget giving C/N0 along the pass (slant range and elevation
+                 dependent atmosphere loss, as in LinkBudget.evaluate_pass)
+    symbol_rate: symbols per second, fixed across schemes
+    """
+
+    def __init__(self, link_budget, symbol_rate, target_ber=1e-5,
+                 schemes=("BPSK", "QPSK", "16-QAM"), margin_db=0.0, min_elevation_for_loss=5.0):
+        if symbol_rate <= 0:
+            raise ValueError("symbol_rate must be positive")
+
+        unknown = [s for s in schemes if s not in BITS_PER_SYMBOL]
+        if unknown:
+            raise ValueError(
+                f"Unknown modulation scheme: {unknown[0]} (supported: {', '.join(BITS_PER_SYMBOL)})"
+            )
+
+        self.link_budget = link_budget
+        self.symbol_rate = symbol_rate
+        self.target_ber = target_ber
+        self.margin_db = margin_db
+        self.min_elevation_for_loss = min_elevation_for_loss
+
+        # Slowest first, so a higher index always means more throughput
+        self.schemes = sorted(schemes, key=lambda s: BITS_PER_SYMBOL[s])
+        self.required_eb_no = Modulation.required_eb_no(self.schemes, target_ber)
+        self.bit_rates = np.array([symbol_rate * BITS_PER_SYMBOL[s] for s in self.schemes], dtype=np.float64)
+
+        # Scheme k closes when C/N0 >= required Eb/N0 + margin + 10*log10(bit rate)
+        self.c_n0_thresholds = self.required_eb_no + margin_db + _LOG10_FACTOR_10 * np.log(self.bit_rates)
+
+        # Optimization: drop schemes that a faster scheme beats at a lower C/N0, so the
+        # remaining thresholds ascend with throughput and selection is one searchsorted
+        # call instead of a (samples x schemes) comparison.
+        candidates = []
+        lowest = np.inf
+        for k in range(len(self.schemes) - 1, -1, -1):
+            if self.c_n0_thresholds[k] < lowest:
+                candidates.append(k)
+                lowest = self.c_n0_thresholds[k]
+        self._candidates = np.array(candidates[::-1] + [-1], dtype=np.intp)
+        self._candidate_thresholds = self.c_n0_thresholds[self._candidates[:-1]]
+
+        # Bit rate by scheme index; index -1 (no scheme closes) maps to the trailing 0
+        self._rates = np.append(self.bit_rates, 0.0)
+
+    def select(self, c_n0_dbhz):
+        """
+        Index into self.schemes of the fastest scheme that closes at each C/N0 (dBHz),
+        or -1 where none does. Works element-wise on arrays.
+        """
+        position = np.searchsorted(self._candidate_thresholds, c_n0_dbhz, side="right")
+        # position 0 (below every threshold) wraps to the trailing -1 sentinel
+        return self._candidates[position - 1]
+
+    def plan(self, passes):
+        """
+        Plans a whole schedule of PassData objects in one vectorized evaluation.
+
+        Returns a dict with:
+            scheme_index, rate_bps, c_n0_dbhz: per-pass lists of arrays (views)
+            bits: (P,) bits delivered per pass
+            total_bits: sum over the schedule
+        """
+        passes = list(passes)
+        counts = np.array([len(p) for p in passes], dtype=np.intp)
+
+        if len(passes) == 0:
+            return {"scheme_index": [], "rate_bps": [], "c_n0_dbhz": [],
+                    "bits": np.zeros(0), "total_bits": 0.0}
+
+        # Optimization: concatenate every pass so the link budget and selection run
+        # once per schedule rather than once per pass
+        range_km = np.concatenate([p.range_km for p in passes])
+        el = np.concatenate([p.el for p in passes])
+        durations = np.concatenate([p.durations for p in passes])
+
+        atmosphere = self.link_budget.atmosphere_loss_at(el, self.min_elevation_for_loss)
+        c_n0 = self.link_budget.evaluate(distance_km=range_km, atmosphere_loss=atmosphere)["c_n0_dbhz"]
+
+        scheme_index = self.select(c_n0)
+        rate = self._rates[scheme_index]
+
+        # Per-pass sums from one cumulative sum, which also handles empty passes
+        cumulative = np.zeros(len(rate) + 1)
+        np.cumsum(rate * durations, out=cumulative[1:])
+        ends = np.cumsum(counts)
+        bits = cumulative[ends] - cumulative[ends - counts]
+
+        split = ends[:-1]
+        return {
+            "scheme_index": np.split(scheme_index, split),
+            "rate_bps": np.split(rate, split),
+            "c_n0_dbhz": np.split(c_n0, split),
+            "bits": bits,
+            "total_bits": float(cumulative[-1]),
+        }
+
+    def plan_pass(self, pass_data):
+        """Plans a single pass. Same keys as plan(), with arrays and bits for this pass only."""
+        plan = self.plan([pass_data])
+        return {
+            "scheme_index": plan["scheme_index"][0],
+            "rate_bps": plan["rate_bps"][0],
+            "c_n0_dbhz": plan["c_n0_dbhz"][0],
+            "bits": float(plan["bits"][0]),
+        }
@@ -0,0 +1,140 @@
+import math
+import os
+import statistics
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import numpy as np
+from shannon.modulation import BITS_PER_SYMBOL, Modulation
+
+
+def simulate_ber_sweep(schemes, eb_no_db, seed=None, max_workers=None,
+                       target_errors=100, max_bits=10**9, rel_tolerance=0.1,
+                       confidence=0.95, job_symbols=2**20, chunk_symbols=65536):
+    """
+    Monte Carlo BER of every scheme at every Eb/N0 (dB), with the symbols of each
+    point split into jobs of job_symbols symbols that run across a process pool.
+
+    Job j of point p draws from the SeedSequence child with spawn key (p, j), i.e.
+    SeedSequence(seed).spawn(P)[p].spawn(...)[j], and job results are merged in job
+    order, so the result depends on seed only: not on max_workers or scheduling.
+
+    A point stops after the first merged job at which either max_bits bits have been
+    sent, or at least target_errors errors have been counted and the normal-approximation
+    confidence interval of the BER is within rel_tolerance of the estimate.
+
+    max_workers: number of worker processes (None = os.cpu_count()). 1 runs in-process.
+
+    Returns results[scheme_index][point_index], a dict with scheme, eb_no_db, ber,
+    errors, bits, jobs, ci_low and ci_high.
+    """
+    entropy = np.random.SeedSequence(seed).entropy
+    z = statistics.NormalDist().inv_cdf(0.5 + 0.5 * confidence)
+
+    eb_no_db = np.atleast_1d(np.asarray(eb_no_db, dtype=np.float64))
+    points = []
+    for scheme in schemes:
+        if scheme not in BITS_PER_SYMBOL:
+            raise ValueError(f"Unknown modulation scheme: {scheme}")
+        for x in eb_no_db:
+            points.append(_SweepPoint(len(points), scheme, float(x), job_symbols * BITS_PER_SYMBOL[scheme]))
+
+    def job(point, job_index):
+        return (point.index, job_index, point.scheme, point.eb_no_db, entropy,
+                job_symbols, chunk_symbols)
+
+    def merge(point, errors, bits):
+        point.errors += errors
+        point.bits += bits
+        point.jobs += 1
+        if point.bits >= max_bits:
+            point.done = True
+        elif point.errors >= target_errors:
+            point.done = _half_width(point.errors, point.bits, z) <= rel_tolerance * point.errors / point.bits
+
+    if max_workers == 1:
+        for point in points:
+            while not point.done:
+                _, _, errors, bits = _run_ber_job(job(point, point.jobs))
+                merge(point, errors, bits)
+    else:
+        workers = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # Keep every worker busy without queueing jobs far past a point's early stop
+            max_in_flight = 2 * workers
+            in_flight = {}
+
+            def submit_jobs():
+                while len(in_flight) < max_in_flight:
+                    # Top up the open point with the fewest outstanding jobs
+                    open_points = [
+                        p for p in points
+                        if not p.done and p.submitted * p.job_bits < max_bits
+                    ]
+                    if not open_points:
+                        return
+                    point = min(open_points, key=lambda p: p.submitted - p.jobs)
+                    future = executor.submit(_run_ber_job, job(point, point.submitted))
+                    in_flight[future] = point
+                    point.submitted += 1
+
+            submit_jobs()
+            while in_flight:
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    point = in_flight.pop(future)
+                    _, job_index, errors, bits = future.result()
+                    point.pending[job_index] = (errors, bits)
+                    # Merge in job order; results past the stopping job are discarded
+                    while not point.done and point.jobs in point.pending:
+                        merge(point, *point.pending.pop(point.jobs))
+                submit_jobs()
+
+    n = len(eb_no_db)
+    return [
+        [_point_result(point, z) for point in points[i * n:(i + 1) * n]]
+        for i in range(len(schemes))
+    ]
+
+
+class _SweepPoint:
+    def __init__(self, index, scheme, eb_no_db, job_bits):
+        self.index = index
+        self.scheme = scheme
+        self.eb_no_db = eb_no_db
+        self.job_bits = job_bits
+        self.errors = 0
+        self.bits = 0
+        self.jobs = 0
+        self.submitted = 0
+        self.pending = {}
+        self.done = False
+
+
+def _half_width(errors, bits, z):
+    ber = errors / bits
+    return z * math.sqrt(ber * (1.0 - ber) / bits)
+
+
+def _point_result(point, z):
+    ber = point.errors / point.bits if point.bits else 0.0
+    half_width = _half_width(point.errors, point.bits, z) if point.bits else 0.0
+    return {
+        'scheme': point.scheme,
+        'eb_no_db': point.eb_no_db,
+        'ber': ber,
+        'errors': point.errors,
+        'bits': point.bits,
+        'jobs': point.jobs,
+        'ci_low': max(ber - half_width, 0.0),
+        'ci_high': ber + half_width,
+    }
+
+
+def _run_ber_job(job):
+    point_index, job_index, scheme, eb_no_db, entropy, num_symbols, chunk_symbols = job
+    # Equivalent to SeedSequence(entropy).spawn(...)[point_index].spawn(...)[job_index]
+    seed = np.random.SeedSequence(entropy, spawn_key=(point_index, job_index))
+    result = Modulation(scheme, seed=seed).simulate_ber(
+        eb_no_db, target_errors=math.inf,
+        max_bits=num_symbols * BITS_PER_SYMBOL[scheme], chunk_symbols=chunk_symbols
+    )
+    return point_index, job_index, result['errors'], result['bits']
@@ -0,0 +1,200 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+import numpy as np
+from sgp4.api import Satrec
+from shannon.instrumentation import span
+
+# Reference epoch of the aligned propagation grid (J2000.0, JD 2451545.0).
+# Grid node k is at J2000 + k * step_seconds, so overlapping requests hit the same nodes.
+_GRID_EPOCH_JD = 2451545.0
+
+
+class LRUCache:
+    """
+    A thread-safe LRU cache with optional TTL and memory cap.
+    maxsize: maximum number of entries (None = unbounded)
+    ttl: seconds after insertion an entry expires (None = never)
+    max_bytes: maximum total size of the entries, as reported to put() (None = unbounded)
+    """
+
+    def __init__(self, maxsize=None, ttl=None, max_bytes=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (value, nbytes, expires_at)
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def nbytes(self):
+        return self._nbytes
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            value, nbytes, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value, nbytes=0):
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            # Never cache an entry larger than the whole budget
+            return
+
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, nbytes, expires_at)
+            self._nbytes += nbytes
+
+            # Evict least recently used entries until within limits
+            while (
+                (self.maxsize is not None and len(self._entries) > self.maxsize)
+                or (self.max_bytes is not None and self._nbytes > self.max_bytes)
+            ):
+                self._remove(next(iter(self._entries)))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def _remove(self, key):
+        _, nbytes, _ = self._entries.pop(key)
+        self._nbytes -= nbytes
+
+
+def tle_checksum(tle_line1, tle_line2):
+    """Stable key identifying a TLE."""
+    return hashlib.sha1(
+        (tle_line1.strip() + "\n" + tle_line2.strip()).encode("ascii")
+    ).hexdigest()
+
+
+# Process-wide cache of parsed TLEs. Parsing is cheap but popular TLEs are parsed
+# on every API request.
+SATREC_CACHE = LRUCache(maxsize=4096)
+
+
+def parse_tle(tle_line1, tle_line2, key=None):
+    """Returns the Satrec for a TLE, reusing a previously parsed one when possible."""
+    if key is None:
+        key = tle_checksum(tle_line1, tle_line2)
+    satellite = SATREC_CACHE.get(key)
+    if satellite is None:
+        with span("tle_parse"):
+            satellite = Satrec.twoline2rv(tle_line1, tle_line2)
+        SATREC_CACHE.put(key, satellite)
+    return satellite
+
+
+def grid_seconds(jd, fr):
+    """Seconds from the grid epoch to the time (jd, fr)."""
+    return ((jd - _GRID_EPOCH_JD) + fr) * 86400.0
+
+
+def propagate_nodes(satellite, step_seconds, first_node, num_nodes):
+    """
+    Propagates the satellite at aligned grid nodes first_node .. first_node + num_nodes - 1,
+    where node k is at J2000 + k * step_seconds. Returns e (T,), r (T, 3), v (T, 3).
+    """
+    # Split node times into whole days and a day fraction to keep fr small
+    seconds = np.arange(first_node, first_node + num_nodes, dtype=np.float64)
+    seconds *= step_seconds
+    days = np.floor(seconds / 86400.0)
+    fr_arr = seconds - days * 86400.0
+    fr_arr /= 86400.0
+    days += _GRID_EPOCH_JD
+    with span("sgp4"):
+        return satellite.sgp4_array(days, fr_arr)
+
+
+class EphemerisCache:
+    """
+    Cache of propagated (e, r, v) ephemeris chunks on the aligned grid.
+    Keys are (TLE checksum, step_seconds, chunk index), where a chunk holds
+    chunk_nodes consecutive grid nodes, so repeated or overlapping requests
+    for the same TLE reuse the same chunks instead of re-running SGP4.
+    Cached arrays are read-only.
+    """
+
+    def __init__(self, chunk_nodes=256, maxsize=None, ttl=3600.0, max_bytes=256 * 1024 * 1024):
+        self.chunk_nodes = chunk_nodes
+        self._cache = LRUCache(maxsize=maxsize, ttl=ttl, max_bytes=max_bytes)
+
+    @property
+    def hits(self):
+        return self._cache.hits
+
+    @property
+    def misses(self):
+        return self._cache.misses
+
+    @property
+    def nbytes(self):
+        return self._cache.nbytes
+
+    def __len__(self):
+        return len(self._cache)
+
+    def clear(self):
+        self._cache.clear()
+
+    def propagate_nodes(self, satellite, key, step_seconds, first_node, num_nodes):
+        """Cached equivalent of propagate_nodes(); key is the TLE checksum."""
+        if num_nodes <= 0:
+            return propagate_nodes(satellite, step_seconds, first_node, 0)
+
+        first_chunk = first_node // self.chunk_nodes
+        last_chunk = (first_node + num_nodes - 1) // self.chunk_nodes
+
+        chunks = [
+            self._get_chunk(satellite, key, step_seconds, c)
+            for c in range(first_chunk, last_chunk + 1)
+        ]
+
+        start = first_node - first_chunk * self.chunk_nodes
+        stop = start + num_nodes
+        if len(chunks) == 1:
+            e, r, v = chunks[0]
+            return e[start:stop], r[start:stop], v[start:stop]
+
+        e, r, v = (np.concatenate(arrays) for arrays in zip(*chunks))
+        return e[start:stop], r[start:stop], v[start:stop]
+
+    def _get_chunk(self, satellite, key, step_seconds, chunk):
+        cache_key = (key, step_seconds, chunk)
+        ephemeris = self._cache.get(cache_key)
+        if ephemeris is None:
+            ephemeris = propagate_nodes(
+                satellite, step_seconds, chunk * self.chunk_nodes, self.chunk_nodes
+            )
+            for arr in ephemeris:
+                arr.setflags(write=False)
+            self._cache.put(cache_key, ephemeris, nbytes=sum(arr.nbytes for arr in ephemeris))
+        return ephemeris
+
+
+# Process-wide ephemeris cache used by the API
+EPHEMERIS_CACHE = EphemerisCache()
@@ -0,0 +1,153 @@
+"""
+Earth rotation for the TEME to ECEF step.
+
+SGP4 positions are in TEME, which is rotated into the pseudo-Earth-fixed frame
+by the IAU-82 Greenwich Mean Sidereal Time alone (the equation of the equinoxes
+is already part of TEME). Polar motion, which moves that frame by < 15 m at the
+surface, is not applied.
+
+GMST is evaluated on UT1. Without Earth orientation data UT1 = UTC is assumed
+(|UT1 - UTC| < 0.9 s, ~400 m at the equator). Load a local EOP file with
+load_eop(), or set SHANNON_EOP_FILE before import, to apply UT1 - UTC.
+
+Time grids evaluated by many stations and satellites share their cos/sin GMST
+tables through grid_rotation(), cached by (jd, fr, step, n).
+"""
+import os
+import threading
+import numpy as np
+from shannon.cache import LRUCache
+
+_TWO_PI = 2.0 * np.pi
+_DEG2RAD = np.pi / 180.0
+_MJD_OFFSET = 2400000.5
+
+# Earth orientation table: (MJD (UTC), UT1 - UTC seconds), or None
+_eop = None
+_eop_lock = threading.Lock()
+
+# cos/sin GMST tables of regular time grids
+ROTATION_CACHE = LRUCache(maxsize=256, max_bytes=64 * 1024 * 1024)
+
+
+def load_eop(path):
+    """
+    Loads UT1 - UTC from a local Earth orientation file and returns the number of
+    entries. Accepts IERS finals / finals2000A files (fixed columns) and plain
+    text with "MJD UT1-UTC" columns (whitespace or comma separated, '#' comments).
+    Between entries UT1 - UTC is interpolated linearly; outside the table the
+    first/last value is held.
+    """
+    mjd = []
+    ut1_utc = []
+    with open(path) as f:
+        for line in f:
+            if len(line) >= 68 and line[57] in "IP":
+                # IERS finals: MJD in columns 8-15, UT1-UTC in columns 59-68
+                mjd.append(float(line[7:15]))
+                ut1_utc.append(float(line[58:68]))
+                continue
+            fields = line.split("#", 1)[0].replace(",", " ").split()
+            if len(fields) < 2:
+                continue
+            try:
+                mjd.append(float(fields[0]))
+                ut1_utc.append(float(fields[1]))
+            except ValueError:
+                continue  # header line
+
+    if not mjd:
+        raise ValueError(f"No UT1-UTC entries in {path}")
+
+    order = np.argsort(mjd, kind="stable")
+    set_eop(np.asarray(mjd)[order], np.asarray(ut1_utc)[order])
+    return len(mjd)
+
+
+def set_eop(mjd, ut1_utc):
+    """Sets the UT1 - UTC table directly; None clears it (UT1 = UTC)."""
+    global _eop
+    with _eop_lock:
+        _eop = None if mjd is None else (
+            np.asarray(mjd, dtype=np.float64), np.asarray(ut1_utc, dtype=np.float64)
+        )
+        # Cached tables were computed with the previous UT1 - UTC
+        ROTATION_CACHE.clear()
+
+
+def ut1_utc(jd, fr):
+    """UT1 - UTC (seconds) at the UTC Julian date jd + fr; 0.0 without EOP data."""
+    eop = _eop
+    if eop is None:
+        return 0.0
+    mjd = (jd - _MJD_OFFSET) + fr
+    return np.interp(mjd, eop[0], eop[1])
+
+
+def gmst(jd, fr):
+    """
+    IAU-82 Greenwich Mean Sidereal Time (rad, in [0, 2pi)) at the UTC Julian date
+    jd + fr, as sgp4.propagation.gstime computes it on UT1.
+    Handles both scalar and array inputs via numpy broadcasting.
+    """
+    if _eop is not None:
+        fr = fr + ut1_utc(jd, fr) / 86400.0
+
+    # IAU-82 in degrees: 280.46061837 + 360.98564736629 d + 0.000387933 T^2 - T^3 / 38710000,
+    # with d the UT1 days and T the UT1 centuries from J2000 (the sgp4 gstime polynomial)
+    if isinstance(jd, np.ndarray) or isinstance(fr, np.ndarray):
+        d = np.add(fr, np.subtract(jd, 2451545.0))
+
+        # Optimization: a sequence of in-place operations avoids allocating
+        # temporary arrays, and floor-based reduction is faster than np.mod.
+        correction = d * (-1.0 / (36525.0 * 38710000.0))
+        correction += 0.000387933
+        correction *= d
+        correction *= d * (1.0 / 36525.0 ** 2)
+
+        gmst = d
+        gmst *= 360.98564736629
+        gmst += 280.46061837
+        gmst += correction
+
+        temp = np.divide(gmst, 360.0, out=correction)
+        np.floor(temp, out=temp)
+        temp *= 360.0
+        gmst -= temp
+
+        gmst *= _DEG2RAD
+        return gmst
+
+    d = (jd - 2451545.0) + fr
+    t = d / 36525.0
+    gmst = 280.46061837 + 360.98564736629 * d + t * t * (0.000387933 - t / 38710000.0)
+    return (gmst % 360.0) * _DEG2RAD
+
+
+def rotation(jd, fr):
+    """(cos, sin) of GMST at the UTC Julian date jd + fr."""
+    theta = gmst(jd, fr)
+    return np.cos(theta), np.sin(theta)
+
+
+def grid_rotation(jd, fr, step_seconds, n):
+    """
+    Read-only (cos, sin) of GMST at jd + fr + i * step_seconds, i = 0 .. n - 1.
+    The tables are cached by (jd, fr, step_seconds, n), so every station and
+    satellite evaluating the same grid shares one trigonometric evaluation.
+    """
+    key = (float(jd), float(fr), float(step_seconds), int(n))
+    table = ROTATION_CACHE.get(key)
+    if table is None:
+        fr_arr = np.arange(n, dtype=np.float64)
+        fr_arr *= step_seconds / 86400.0
+        fr_arr += fr
+        table = rotation(jd, fr_arr)
+        for arr in table:
+            arr.setflags(write=False)
+        ROTATION_CACHE.put(key, table, nbytes=table[0].nbytes + table[1].nbytes)
+    return table
+
+
+if os.environ.get("SHANNON_EOP_FILE"):
+    load_eop(os.environ["SHANNON_EOP_FILE"])
@@ -0,0 +1,187 @@
+import datetime
+import json
+import os
+import numpy as np
+from sgp4.api import SatrecArray, jday
+from shannon.cache import parse_tle
+from shannon.orbits import PassPredictor
+
+_INDEX_FILE = "index.json"
+_FORMAT_VERSION = 1
+
+
+class EphemerisSlice:
+    """
+    A zero-copy time slice of one satellite's stored ephemeris.
+    r, v: (T, 3) TEME position (km) and velocity (km/s), read-only views into the store
+    e: (T,) SGP4 error codes
+    jd, fr: Julian date (scalar) and day fractions (T,) of the samples
+    start_time: datetime of the first sample, step_seconds: sample spacing
+    """
+
+    def __init__(self, sat_id, tle_line1, tle_line2, start_time, step_seconds, jd, fr, e, r, v):
+        self.sat_id = sat_id
+        self.tle_line1 = tle_line1
+        self.tle_line2 = tle_line2
+        self.start_time = start_time
+        self.step_seconds = step_seconds
+        self.jd = jd
+        self.fr = fr
+        self.e = e
+        self.r = r
+        self.v = v
+
+    def __len__(self):
+        return len(self.fr)
+
+    @property
+    def offsets(self):
+        """Seconds of each sample from start_time."""
+        return np.arange(len(self.fr), dtype=np.float64) * self.step_seconds
+
+    @property
+    def end_time(self):
+        return self.start_time + datetime.timedelta(seconds=self.step_seconds * (len(self.fr) - 1))
+
+
+class EphemerisStore:
+    """
+    Precomputed TEME ephemeris for a catalog of satellites on a common time grid,
+    stored as .npy files in a directory and opened as read-only memory maps.
+
+    Propagate the catalog once per TLE update with EphemerisStore.write(), then
+    open it with EphemerisStore(path) from any number of worker processes: they
+    all share the same page-cached, read-only copy without re-running SGP4.
+
+    Layout:
+        index.json  grid (epoch, step, length) and the TLE of every satellite
+        e.npy       (N, T) uint8 SGP4 error codes
+        r.npy       (N, T, 3) float64 positions, km
+        v.npy       (N, T, 3) float64 velocities, km/s
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, _INDEX_FILE)) as f:
+            index = json.load(f)
+
+        if index["version"] != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported ephemeris store version: {index['version']}")
+
+        self.start_time = datetime.datetime.fromisoformat(index["start_time"])
+        self.step_seconds = index["step_seconds"]
+        self.num_steps = index["num_steps"]
+        self.satellites = index["satellites"]
+        self._ids = {sat["id"]: i for i, sat in enumerate(self.satellites)}
+        self.jd, self.fr = _julian_date(self.start_time)
+
+        self.e = np.load(os.path.join(path, "e.npy"), mmap_mode="r")
+        self.r = np.load(os.path.join(path, "r.npy"), mmap_mode="r")
+        self.v = np.load(os.path.join(path, "v.npy"), mmap_mode="r")
+
+    def __len__(self):
+        return len(self.satellites)
+
+    @property
+    def ids(self):
+        return [sat["id"] for sat in self.satellites]
+
+    @property
+    def end_time(self):
+        return self.start_time + datetime.timedelta(seconds=self.step_seconds * (self.num_steps - 1))
+
+    @classmethod
+    def write(cls, path, tles, start_time, end_time, step_seconds=60.0, ids=None, batch_size=256):
+        """
+        Propagates every TLE on the grid start_time, start_time + step_seconds, ... up to
+        end_time and writes the store to the directory `path`.
+        tles: list of (tle_line1, tle_line2) pairs
+        ids: satellite identifiers (default: NORAD catalog numbers from the TLEs)
+        batch_size: satellites propagated per SatrecArray call, bounding memory use
+        """
+        if ids is None:
+            ids = [line1[2:7].strip() for line1, _ in tles]
+        if len(ids) != len(tles):
+            raise ValueError("ids and tles must have the same length")
+        if len(set(ids)) != len(ids):
+            raise ValueError("Satellite ids must be unique")
+
+        num_steps = int((end_time - start_time).total_seconds() // step_seconds) + 1
+        jd_start, fr_start = _julian_date(start_time)
+        fr_arr = np.arange(num_steps, dtype=np.float64)
+        fr_arr *= (step_seconds / 86400.0)
+        fr_arr += fr_start
+        jd_arr = np.empty(num_steps, dtype=np.float64)
+        jd_arr.fill(jd_start)
+
+        os.makedirs(path, exist_ok=True)
+        shape = (len(tles), num_steps)
+        # Write through memory maps so catalogs larger than RAM can be stored batch by batch
+        e_out = np.lib.format.open_memmap(os.path.join(path, "e.npy"), mode="w+", dtype=np.uint8, shape=shape)
+        r_out = np.lib.format.open_memmap(os.path.join(path, "r.npy"), mode="w+", dtype=np.float64, shape=shape + (3,))
+        v_out = np.lib.format.open_memmap(os.path.join(path, "v.npy"), mode="w+", dtype=np.float64, shape=shape + (3,))
+
+        for batch_start in range(0, len(tles), batch_size):
+            batch = tles[batch_start:batch_start + batch_size]
+            satellites = SatrecArray([parse_tle(line1, line2) for line1, line2 in batch])
+            e, r, v = satellites.sgp4(jd_arr, fr_arr)
+            batch_slice = slice(batch_start, batch_start + len(batch))
+            e_out[batch_slice] = e
+            r_out[batch_slice] = r
+            v_out[batch_slice] = v
+
+        for arr in (e_out, r_out, v_out):
+            arr.flush()
+        del e_out, r_out, v_out
+
+        # The index is written last, so a store is only readable once complete
+        index = {
+            "version": _FORMAT_VERSION,
+            "start_time": start_time.isoformat(),
+            "step_seconds": step_seconds,
+            "num_steps": num_steps,
+            "satellites": [
+                {"id": sat_id, "tle_line1": line1, "tle_line2": line2}
+                for sat_id, (line1, line2) in zip(ids, tles)
+            ],
+        }
+        with open(os.path.join(path, _INDEX_FILE), "w") as f:
+            json.dump(index, f)
+
+        return cls(path)
+
+    def slice(self, sat_id, start_time=None, end_time=None):
+        """
+        Returns the samples of satellite `sat_id` with start_time <= t <= end_time
+        as an EphemerisSlice of zero-copy views. Defaults to the whole store.
+        """
+        index = self._ids[sat_id]
+        sat = self.satellites[index]
+
+        first = 0
+        if start_time is not None:
+            first = max(int(np.ceil((start_time - self.start_time).total_seconds() / self.step_seconds)), 0)
+        stop = self.num_steps
+        if end_time is not None:
+            stop = min(int((end_time - self.start_time).total_seconds() // self.step_seconds) + 1, self.num_steps)
+        stop = max(stop, first)
+
+        fr = np.arange(first, stop, dtype=np.float64)
+        fr *= (self.step_seconds / 86400.0)
+        fr += self.fr
+
+        return EphemerisSlice(
+            sat_id, sat["tle_line1"], sat["tle_line2"],
+            self.start_time + datetime.timedelta(seconds=self.step_seconds * first),
+            self.step_seconds, self.jd, fr,
+            self.e[index, first:stop], self.r[index, first:stop], self.v[index, first:stop],
+        )
+
+    def predictor(self, sat_id, **kwargs):
+        """A PassPredictor for the stored TLE of `sat_id`."""
+        sat = self.satellites[self._ids[sat_id]]
+        return PassPredictor(sat["tle_line1"], sat["tle_line2"], **kwargs)
+
+
+def _julian_date(t):
+    return jday(t.year, t.month, t.day, t.hour, t.minute, t.second + t.microsecond * 1e-6)
@@ -0,0 +1,89 @@
+import datetime
+from concurrent.futures import ProcessPoolExecutor
+from shannon.orbits import PassPredictor
+from shannon.ground_station import GroundStation
+
+
+def forecast_passes(tles, stations, start_time, end_time, max_workers=None,
+                    window_hours=24.0, chunk_size=1,
+                    step_seconds=30, min_elevation=0.0, prefilter=True):
+    """
+    Predicts every pass of every satellite over every station between start_time
+    and end_time, sharding the work across a process pool.
+
+    tles: list of (tle_line1, tle_line2) pairs
+    stations: list of GroundStation objects or (lat, lon, alt) tuples
+    max_workers: number of worker processes (None = os.cpu_count()). 1 runs in-process.
+    window_hours: length of the time windows the forecast is split into. Each
+                  (satellite, station, window) triple is one job. A job returns the
+                  passes starting in its window, each followed to its LOS (or
+                  end_time) however long it lasts, so MEO/GEO passes crossing window
+                  boundaries come back whole.
+    chunk_size: number of jobs sent to a worker at a time.
+    prefilter: skip satellites and coarse-scan nodes where a geometric visibility
+               bound rules out a pass (see PassPredictor). Results are unchanged.
+
+    Returns results[sat_index][station_index] = list of PassData sorted by AOS.
+    The merge is deterministic: it does not depend on max_workers or chunk_size.
+    """
+    stations = [
+        (gs.lat, gs.lon, gs.alt) if isinstance(gs, GroundStation) else tuple(gs)
+        for gs in stations
+    ]
+
+    window = datetime.timedelta(hours=window_hours)
+
+    windows = []
+    window_start = start_time
+    while window_start < end_time:
+        window_end = min(window_start + window, end_time)
+        windows.append((window_start, window_end))
+        window_start = window_end
+
+    jobs = [
+        (sat_index, station_index, tle, station, window_start, window_end,
+         start_time, end_time, step_seconds, min_elevation, prefilter)
+        for sat_index, tle in enumerate(tles)
+        for station_index, station in enumerate(stations)
+        for window_start, window_end in windows
+    ]
+
+    results = [[[] for _ in stations] for _ in tles]
+
+    if max_workers == 1:
+        job_results = map(_run_forecast_job, jobs)
+        _merge_job_results(results, job_results)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # Executor.map yields in submission order, which keeps the merge deterministic
+            job_results = executor.map(_run_forecast_job, jobs, chunksize=chunk_size)
+            _merge_job_results(results, job_results)
+
+    return results
+
+
+def _merge_job_results(results, job_results):
+    # Jobs are generated window by window in time order, so appending keeps AOS order
+    for sat_index, station_index, passes in job_results:
+        results[sat_index][station_index].extend(passes)
+
+
+def _run_forecast_job(job):
+    (sat_index, station_index, (tle_line1, tle_line2), (lat, lon, alt),
+     window_start, window_end, start_time, end_time, step_seconds, min_elevation,
+     prefilter) = job
+
+    predictor = PassPredictor(tle_line1, tle_line2, prefilter=prefilter)
+    station = GroundStation(lat, lon, alt)
+    # A pass still in progress at window_end is followed to its LOS
+    passes = predictor.get_passes(
+        station, window_start, window_end, step_seconds=step_seconds,
+        min_elevation=min_elevation, extend_to=end_time
+    )
+
+    # A pass already in progress at window_start (AOS clamped to it) belongs to the
+    # previous window, which followed it to its LOS, unless this is the first
+    # window of the forecast.
+    passes = [p for p in passes if p.aos > window_start or window_start == start_time]
+
+    return sat_index, station_index, passes
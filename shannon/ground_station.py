@@ -1,8 +1,10 @@
 import math
 import datetime
 import numpy as np
-from shannon.utils import EARTH_RADIUS_KM
+from shannon.utils import EARTH_RADIUS_KM, EARTH_ROTATION_RATE
+from shannon import earth_rotation
 from sgp4.api import jday
+from shannon.instrumentation import span
 
 class GroundStation:
     def __init__(self, lat, lon, alt):
@@ -57,20 +59,38 @@ class GroundStation:
 
         return np.array([x, y, z]) # km
 
-    def compute_look_angles(self, satellite_eci, time, jd=None, fr=None, mask_invisible=False):
+    def compute_look_angles(self, satellite_eci, time, jd=None, fr=None, mask_invisible=False,
+                            rotation=None):
         """
         Computes Azimuth and Elevation from the ground station to the satellite.
-        satellite_eci: [x, y, z] in km (TEME/ECI frame)
+        satellite_eci: [x, y, z] in km (TEME/ECI frame). Arrays of shape (..., 3) are
+                       supported, e.g. (T, 3) for one satellite or (N, T, 3) for N satellites
+                       sharing the same T time steps. A shannon.ephemeris.EphemerisSlice
+                       is also accepted, in which case its own jd/fr are used.
         time: datetime object or list/array of datetime objects
         jd, fr: Optional pre-calculated Julian Date components (to avoid re-calculation)
         mask_invisible: If True, returns NaN for points where satellite is below horizon (optimization).
+        rotation: optional precomputed (cos, sin) of GMST at the times, e.g. from
+                  shannon.earth_rotation.grid_rotation(), replacing the GMST evaluation.
         """
+        with span("look_angles"):
+            return self._compute_look_angles(satellite_eci, time, jd, fr, mask_invisible, rotation)
+
+    def _compute_look_angles(self, satellite_eci, time, jd=None, fr=None, mask_invisible=False,
+                             rotation=None):
+        # Precomputed ephemeris (an EphemerisSlice, checked by attribute so this module
+        # does not import shannon.ephemeris and, through it, shannon.orbits)
+        # carries its own time grid
+        if hasattr(satellite_eci, "fr"):
+            jd, fr = satellite_eci.jd, satellite_eci.fr
+            satellite_eci = satellite_eci.r
+
         # Ensure input is numpy array if list
         if isinstance(satellite_eci, list):
             satellite_eci = np.array(satellite_eci)
 
-        # GMST calculation
-        gmst = self._calculate_gmst(time, jd=jd, fr=fr)
+        # GMST rotation (cos, sin)
+        cos_g, sin_g = self._rotation(time, jd, fr, rotation)
 
         # Optimization: When asking to mask invisible points, we can compute the 'Up' component (u)
         # directly from ECI coordinates without converting the full satellite position to ECEF.
@@ -86,13 +106,10 @@ class GroundStation:
         if satellite_eci.ndim == 1:
             sat_x, sat_y, sat_z = satellite_eci
         else:
-            sat_x, sat_y, sat_z = satellite_eci[:, 0], satellite_eci[:, 1], satellite_eci[:, 2]
+            sat_x, sat_y, sat_z = satellite_eci[..., 0], satellite_eci[..., 1], satellite_eci[..., 2]
 
         # If optimization applies (vectorized and masking requested)
         if mask_invisible and satellite_eci.ndim > 1:
-            cos_g = np.cos(gmst)
-            sin_g = np.sin(gmst)
-
             Ux, Uy, Uz = self.U_ecef
 
             # Rotate U_ecef to U_eci frame (inverse rotation of ECI->ECEF)
@@ -135,6 +152,11 @@ class GroundStation:
             # But we only do it for the visible subset.
 
             # Filter GMST related values
+            # For batched (N, T) inputs the GMST terms are shared across satellites,
+            # so broadcast them (as views, no copy) to the shape of the mask first.
+            if np.shape(cos_g) != u.shape:
+                cos_g = np.broadcast_to(cos_g, u.shape)
+                sin_g = np.broadcast_to(sin_g, u.shape)
             cos_g_vis = cos_g[visible]
             sin_g_vis = sin_g[visible]
 
@@ -195,7 +217,7 @@ class GroundStation:
             return az, el, range_km
 
         # Legacy/Scalar/No-mask path (Full computation)
-        sat_ecef_x, sat_ecef_y, sat_ecef_z = self._eci_to_ecef(satellite_eci, gmst)
+        sat_ecef_x, sat_ecef_y, sat_ecef_z = self._eci_to_ecef(satellite_eci, rotation=(cos_g, sin_g))
 
         # Vector from station to satellite in ECEF
         rx_x = sat_ecef_x - self.location[0]
@@ -240,8 +262,87 @@ class GroundStation:
 
         return az, el, range_km
 
-    def _calculate_gmst(self, time, jd=None, fr=None):
-        """Calculates Greenwich Mean Sidereal Time."""
+    def compute_range_rate(self, satellite_eci, satellite_vel, time, jd=None, fr=None,
+                           rotation=None):
+        """
+        Computes the range rate (km/s, positive when receding) from the ground station
+        to the satellite, using the exact SGP4 velocity instead of differencing ranges.
+        satellite_eci: [x, y, z] or (..., 3) position in km (TEME/ECI frame)
+        satellite_vel: matching velocity in km/s (TEME/ECI frame)
+        time, jd, fr, rotation: as for compute_look_angles
+        """
+        if isinstance(satellite_eci, list):
+            satellite_eci = np.array(satellite_eci)
+        if isinstance(satellite_vel, list):
+            satellite_vel = np.array(satellite_vel)
+
+        rotation = self._rotation(time, jd, fr, rotation)
+
+        # Rotate position and velocity into ECEF. The velocity seen from the rotating
+        # Earth also loses the transport term w x r_ecef: v_ecef = R(gmst) v - w x r_ecef.
+        x, y, z = self._eci_to_ecef(satellite_eci, rotation=rotation)
+        vx, vy, vz = self._eci_to_ecef(satellite_vel, rotation=rotation)
+        vx += EARTH_ROTATION_RATE * y
+        vy -= EARTH_ROTATION_RATE * x
+
+        # Line of sight from the (fixed in ECEF) station to the satellite
+        rx_x = x - self.location[0]
+        rx_y = y - self.location[1]
+        rx_z = z - self.location[2]
+
+        # Optimization: explicit multiplication and in-place accumulation avoid
+        # temporary arrays, as in compute_look_angles.
+        range_km = rx_x * rx_x
+        range_km += rx_y * rx_y
+        range_km += rx_z * rx_z
+        np.sqrt(range_km, out=range_km)
+
+        range_rate = rx_x * vx
+        range_rate += rx_y * vy
+        range_rate += rx_z * vz
+        range_rate /= range_km
+        return range_rate
+
+    def compute_up_rates(self, satellite_eci, satellite_vel, time, jd=None, fr=None,
+                         rotation=None):
+        """
+        Returns (u, u_rate, range_km, range_rate): the height of the satellite above
+        the station's horizon plane (km, not masked), the range, and their rates
+        (km/s). Elevation rises while u_rate * range_km > u * range_rate.
+        satellite_eci, satellite_vel, time, jd, fr, rotation: as for compute_range_rate
+        """
+        rotation = self._rotation(time, jd, fr, rotation)
+
+        x, y, z = self._eci_to_ecef(satellite_eci, rotation=rotation)
+        vx, vy, vz = self._eci_to_ecef(satellite_vel, rotation=rotation)
+        vx += EARTH_ROTATION_RATE * y
+        vy -= EARTH_ROTATION_RATE * x
+
+        rx_x = x - self.location[0]
+        rx_y = y - self.location[1]
+        rx_z = z - self.location[2]
+
+        u = rx_x * self.R[2, 0]
+        u += rx_y * self.R[2, 1]
+        u += rx_z * self.R[2, 2]
+        u_rate = vx * self.R[2, 0]
+        u_rate += vy * self.R[2, 1]
+        u_rate += vz * self.R[2, 2]
+
+        range_km = rx_x * rx_x
+        range_km += rx_y * rx_y
+        range_km += rx_z * rx_z
+        np.sqrt(range_km, out=range_km)
+
+        range_rate = rx_x * vx
+        range_rate += rx_y * vy
+        range_rate += rx_z * vz
+        range_rate /= range_km
+        return u, u_rate, range_km, range_rate
+
+    @staticmethod
+    def _calculate_gmst(time, jd=None, fr=None):
+        """Calculates Greenwich Mean Sidereal Time (IAU-82, see shannon.earth_rotation)."""
         if jd is None or fr is None:
             if isinstance(time, (list, np.ndarray)):
                 ts = np.array(time) if isinstance(time, list) else time
@@ -255,45 +356,27 @@ class GroundStation:
             else:
                 jd, fr = jday(time.year, time.month, time.day, time.hour, time.minute, time.second + time.microsecond * 1e-6)
 
-        # GMST approximation
-        # Handles both scalar and array inputs via numpy broadcasting
-        # Optimization: Avoid intermediate array allocations for GMST calculation
-        # Using a sequence of in-place operations avoids allocating temporary arrays
-        # and is ~2x faster for large inputs than creating intermediate arrays.
-        if isinstance(jd, np.ndarray) or isinstance(fr, np.ndarray):
-            t_ut1 = jd + fr
-            t_ut1 -= 2451545.0
-
-            gmst = t_ut1
-            gmst *= 360.98564736629
-            gmst += 280.46061837
-
-            # Optimization: for large floating-point numpy arrays,
-            # a sequence of in-place operations is significantly faster
-            # than arr -= 360.0 * np.floor(arr / 360.0) because it
-            # avoids multiple intermediate array allocations.
-            temp = np.divide(gmst, 360.0)
-            np.floor(temp, out=temp)
-            temp *= 360.0
-            gmst -= temp
-
-            gmst *= (np.pi / 180.0)
-            return gmst
-        else:
-            t_ut1 = jd + fr - 2451545.0
-            gmst = 280.46061837 + 360.98564736629 * t_ut1
-            gmst %= 360.0
-            return gmst * (np.pi / 180.0)
+        return earth_rotation.gmst(jd, fr)
+
+    @staticmethod
+    def _rotation(time, jd=None, fr=None, rotation=None):
+        """(cos, sin) of GMST: rotation if given, otherwise computed from time or jd/fr."""
+        if rotation is not None:
+            return rotation
+        gmst = GroundStation._calculate_gmst(time, jd=jd, fr=fr)
+        return np.cos(gmst), np.sin(gmst)
 
-    def _eci_to_ecef(self, eci, gmst):
-        """Rotates ECI vector to ECEF using GMST."""
+    @staticmethod
+    def _eci_to_ecef(eci, gmst=None, rotation=None):
+        """Rotates ECI vector to ECEF using GMST, or its precomputed (cos, sin) rotation."""
         if eci.ndim == 1:
             x, y, z = eci
         else:
-            x, y, z = eci[:, 0], eci[:, 1], eci[:, 2]
+            x, y, z = eci[..., 0], eci[..., 1], eci[..., 2]
 
-        cos_g = np.cos(gmst)
-        sin_g = np.sin(gmst)
+        if rotation is None:
+            rotation = np.cos(gmst), np.sin(gmst)
+        cos_g, sin_g = rotation
 
         # Optimization: breaking down complex arithmetic operations into in-place
         # steps avoids multiple temporary array allocations and reduces memory bandwidth overhead
@@ -304,3 +387,117 @@ class GroundStation:
         z_ecef = z
 
         return x_ecef, y_ecef, z_ecef
+
+
+class GroundStationNetwork:
+    """
+    A set of ground stations evaluated together.
+    Stacks the per-site ECEF locations and ECEF to ENU rotation matrices so the
+    look angles from every station to a satellite are computed for
+    (stations x times) in one broadcasted pass. GMST and the ECI to ECEF rotation
+    of the satellite are computed once and shared by all stations.
+    """
+
+    def __init__(self, stations):
+        """stations: iterable of GroundStation objects"""
+        self.stations = list(stations)
+
+        # Stacked site constants
+        self.location = np.stack([gs.location for gs in self.stations])  # (S, 3)
+        self.R = np.stack([gs.R for gs in self.stations])  # (S, 3, 3)
+
+    def __len__(self):
+        return len(self.stations)
+
+    def compute_look_angles(self, satellite_eci, time, jd=None, fr=None, mask_invisible=False,
+                            rotation=None):
+        """
+        Computes Azimuth, Elevation and Range from every station to the satellite.
+        satellite_eci: [x, y, z] or (T, 3) array in km (TEME/ECI frame)
+        time, jd, fr, rotation: as for GroundStation.compute_look_angles
+        mask_invisible: If True, returns NaN for points where satellite is below a station's horizon.
+        Returns az, el, range_km arrays of shape (S,) + satellite_eci.shape[:-1].
+        """
+        with span("look_angles"):
+            return self._compute_look_angles(satellite_eci, time, jd, fr, mask_invisible, rotation)
+
+    def _compute_look_angles(self, satellite_eci, time, jd=None, fr=None, mask_invisible=False,
+                             rotation=None):
+        if isinstance(satellite_eci, list):
+            satellite_eci = np.array(satellite_eci)
+
+        # Shared across all stations: GMST, its cos/sin and the satellite position in ECEF
+        rotation = GroundStation._rotation(time, jd, fr, rotation)
+        sat_x, sat_y, sat_z = GroundStation._eci_to_ecef(satellite_eci, rotation=rotation)
+
+        # Station constants as (S, 1, ...) columns broadcasting against the time axes
+        expand = (slice(None),) + (np.newaxis,) * np.ndim(sat_x)
+        loc = self.location
+        R = self.R
+
+        # Vector from each station to the satellite in ECEF, shape (S, T)
+        rx_x = sat_x - loc[:, 0][expand]
+        rx_y = sat_y - loc[:, 1][expand]
+        rx_z = sat_z - loc[:, 2][expand]
+
+        # Optimization: breaking down complex arithmetic operations into in-place
+        # steps avoids multiple temporary array allocations and reduces memory bandwidth overhead
+        u = rx_x * R[:, 2, 0][expand]
+        u += rx_y * R[:, 2, 1][expand]
+        u += rx_z * R[:, 2, 2][expand]
+
+        if mask_invisible:
+            # Optimization: only evaluate range and the trigonometric az/el terms for
+            # (station, time) pairs above the horizon.
+            visible = u > 0
+
+            az = np.empty(u.shape, dtype=u.dtype)
+            az.fill(np.nan)
+            el = np.empty(u.shape, dtype=u.dtype)
+            el.fill(np.nan)
+            range_km = np.empty(u.shape, dtype=u.dtype)
+            range_km.fill(np.nan)
+
+            if not np.any(visible):
+                return az, el, range_km
+
+            rx_x = rx_x[visible]
+            rx_y = rx_y[visible]
+            rx_z = rx_z[visible]
+            u = u[visible]
+            # Rotation matrix of the station each visible point belongs to, (K, 3, 3)
+            R = R[np.nonzero(visible)[0]]
+            expand = (slice(None),)
+        else:
+            visible = None
+
+        # Optimization: explicit multiplication (x*x) avoids the overhead of np.power(x, 2) allocation
+        range_vis = rx_x * rx_x
+        range_vis += rx_y * rx_y
+        range_vis += rx_z * rx_z
+        np.sqrt(range_vis, out=range_vis)
+
+        e = rx_x * R[:, 0, 0][expand]
+        e += rx_y * R[:, 0, 1][expand]
+        e += rx_z * R[:, 0, 2][expand]
+
+        n = rx_x * R[:, 1, 0][expand]
+        n += rx_y * R[:, 1, 1][expand]
+        n += rx_z * R[:, 1, 2][expand]
+
+        az_vis = np.arctan2(e, n, out=e)
+        az_vis *= (180.0 / np.pi)
+        np.add(az_vis, 360.0, out=az_vis, where=az_vis < 0)
+
+        np.divide(u, range_vis, out=u)
+        el_vis = np.arcsin(u, out=u)
+        el_vis *= (180.0 / np.pi)
+
+        if visible is None:
+            return az_vis, el_vis, range_vis
+
+        az[visible] = az_vis
+        el[visible] = el_vis
+        range_km[visible] = range_vis
+
+        return az, el, range_km
@@ -0,0 +1,148 @@
+"""
+Opt-in timing instrumentation for the compute pipeline.
+
+Stages are wrapped in `with span("stage"):` blocks. While instrumentation is
+disabled (the default) span() returns a shared no-op context manager, so the
+cost is one function call and a flag check. Enable it with enable() or by
+setting SHANNON_INSTRUMENTATION=1 before import.
+
+When enabled, every span is recorded in a per-stage histogram (exposed in the
+Prometheus text format by render_prometheus()) and, inside a collect() block,
+added to that block's per-stage totals, e.g. for a Server-Timing header.
+Nested spans are recorded independently, so stage totals may overlap.
+"""
+import bisect
+import contextlib
+import contextvars
+import os
+import threading
+import time
+
+# Upper bounds (seconds) of the histogram buckets
+BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+           0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_enabled = os.environ.get("SHANNON_INSTRUMENTATION", "") not in ("", "0")
+_NULL_SPAN = contextlib.nullcontext()
+
+# Per-stage totals of the current collect() block, or None outside one
+_timings = contextvars.ContextVar("shannon_timings", default=None)
+
+
+class Histogram:
+    """Thread-safe cumulative histogram of durations in seconds."""
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # the last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds):
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.sum += seconds
+
+
+class _Registry:
+    def __init__(self):
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, stage):
+        histogram = self.histograms.get(stage)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(stage, Histogram())
+        return histogram
+
+    def clear(self):
+        with self._lock:
+            self.histograms.clear()
+
+
+REGISTRY = _Registry()
+
+
+class _Span:
+    __slots__ = ("stage", "start")
+
+    def __init__(self, stage):
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        REGISTRY.histogram(self.stage).observe(elapsed)
+        timings = _timings.get()
+        if timings is not None:
+            timings[self.stage] = timings.get(self.stage, 0.0) + elapsed
+        return False
+
+
+def span(stage):
+    """Context manager timing the enclosed block as `stage`."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(stage)
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    return _enabled
+
+
+@contextlib.contextmanager
+def collect():
+    """
+    Collects the per-stage totals (seconds) of the spans run inside the block,
+    including those in threads started with a copy of the current context.
+    Yields the dict that is filled in.
+    """
+    timings = {}
+    token = _timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _timings.reset(token)
+
+
+def server_timing(timings):
+    """Formats per-stage totals as a Server-Timing header value (durations in ms)."""
+    return ", ".join(f"{stage};dur={seconds * 1e3:.3f}" for stage, seconds in timings.items())
+
+
+def render_prometheus(metric="shannon_stage_duration_seconds"):
+    """All stage histograms in the Prometheus text exposition format."""
+    lines = [
+        f"# HELP {metric} Time spent in each compute stage.",
+        f"# TYPE {metric} histogram",
+    ]
+    for stage, histogram in sorted(REGISTRY.histograms.items()):
+        with histogram._lock:
+            counts = list(histogram.counts)
+            total = histogram.sum
+            count = histogram.count
+        cumulative = 0
+        for bound, n in zip(histogram.buckets, counts):
+            cumulative += n
+            lines.append(f'{metric}_bucket{{stage="{stage}",le="{bound:g}"}} {cumulative}')
+        lines.append(f'{metric}_bucket{{stage="{stage}",le="+Inf"}} {count}')
+        lines.append(f'{metric}_sum{{stage="{stage}"}} {total!r}')
+        lines.append(f'{metric}_count{{stage="{stage}"}} {count}')
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,128 @@
+import math
+import numpy as np
+
+# Piecewise Chebyshev interpolation of SGP4 ephemeris.
+#
+# Time is split into segments of L seconds on the grid k * L. Within a segment,
+# SGP4 is evaluated at the N Chebyshev points and position and velocity are each
+# interpolated by the degree N - 1 polynomial through them. (Velocity is fitted
+# on its own rather than taken as the derivative of position: SGP4 velocities
+# differ from the derivative of SGP4 positions by up to ~1 m/s on eccentric and
+# deep-space orbits, and callers expect the SGP4 values.)
+#
+# The Chebyshev interpolation remainder bounds the error, per axis, by
+#     2 * (L / 4)^N / N! * max|f^(N)|
+# For a circular orbit of radius r and angular rate w the N-th derivative of
+# position is r * w^N (r * w^(N + 1) for velocity). Eccentric orbits are bounded
+# with the perigee radius and w = (1 + e)^2 times the perigee angular rate, which
+# covers the higher harmonics of the motion near perigee; _DERIVATIVE_MARGIN
+# covers the SGP4 perturbations. segment_seconds() inverts the position bound.
+# For LEO a 1 m tolerance gives 8 SGP4 calls per ~20 min segment.
+
+# SGP4 evaluations per segment (the polynomial degree is one less)
+_NODES_PER_SEGMENT = 8
+# Head-room on r_p * w^N as the bound on the N-th derivative
+_DERIVATIVE_MARGIN = 10.0
+# Segment length bounds (seconds)
+_MIN_SEGMENT_SECONDS = 1.0
+_MAX_SEGMENT_SECONDS = 3600.0
+
+# Chebyshev points on [-1, 1], and the matrix mapping values at them to coefficients
+_X = np.cos(np.pi * (np.arange(_NODES_PER_SEGMENT) + 0.5) / _NODES_PER_SEGMENT)
+_FIT = np.cos(np.outer(np.arange(_NODES_PER_SEGMENT), np.arccos(_X))) * (2.0 / _NODES_PER_SEGMENT)
+_FIT[0] *= 0.5
+
+
+def _perigee(satellite):
+    """(perigee radius km, derivative rate bound rad/s) of the mean orbit."""
+    e = min(satellite.ecco, 0.99)
+    n = satellite.no_kozai / 60.0
+    r_perigee = satellite.a * (1.0 - e) * satellite.radiusearthkm
+    perigee_rate = n * math.sqrt(1.0 + e) / (1.0 - e) ** 1.5
+    return r_perigee, perigee_rate * (1.0 + e) ** 2
+
+
+def error_bound(satellite, segment_seconds):
+    """(position km, velocity km/s) interpolation error bounds for a segment length."""
+    r_perigee, rate = _perigee(satellite)
+    n = _NODES_PER_SEGMENT
+    position = 2.0 * (segment_seconds * rate / 4.0) ** n / math.factorial(n) * _DERIVATIVE_MARGIN * r_perigee
+    return position, position * rate
+
+
+def segment_seconds(satellite, tolerance_km):
+    """Longest segment (seconds) keeping the position error below tolerance_km."""
+    r_perigee, rate = _perigee(satellite)
+    n = _NODES_PER_SEGMENT
+    scaled = tolerance_km * math.factorial(n) / (2.0 * _DERIVATIVE_MARGIN * r_perigee)
+    length = 4.0 / rate * scaled ** (1.0 / n)
+    return min(max(length, _MIN_SEGMENT_SECONDS), _MAX_SEGMENT_SECONDS)
+
+
+class ChebyshevEphemeris:
+    """
+    Interpolated ephemeris on segments k * segment_length of offsets (seconds).
+    propagate(offsets) -> (e, r, v) evaluates SGP4; it is called once for the nodes
+    of all segments missing from the cache. The max_segments most recent segments
+    are kept, so consecutive calls over nearby offsets (e.g. tracking blocks) reuse
+    them. Points in a segment with an SGP4 error at any node get that error code.
+    """
+
+    def __init__(self, propagate, segment_length, max_segments=4):
+        self.propagate = propagate
+        self.segment_length = segment_length
+        self.max_segments = max_segments
+        self.sgp4_calls = 0
+        self._segments = {}  # k -> (error code, (N, 6) coefficients of r and v)
+
+    def __call__(self, offsets):
+        """(e, r, v) at the offsets."""
+        position = offsets / self.segment_length
+        k = np.floor(position)
+        x = position - k
+        x *= 2.0
+        x -= 1.0
+        starts, segment = np.unique(k, return_inverse=True)
+        starts = starts.tolist()
+
+        missing = [start for start in starts if start not in self._segments]
+        if len(missing) * _NODES_PER_SEGMENT >= len(offsets):
+            # Fewer SGP4 calls without interpolation
+            self.sgp4_calls += len(offsets)
+            return self.propagate(offsets)
+
+        if missing:
+            nodes = (np.array(missing)[:, np.newaxis] + 0.5 * (_X + 1.0)) * self.segment_length
+            e, r, v = self.propagate(nodes.ravel())
+            self.sgp4_calls += nodes.size
+            e = e.reshape(-1, _NODES_PER_SEGMENT).max(axis=1)
+            values = np.concatenate((r, v), axis=1).reshape(-1, _NODES_PER_SEGMENT, 6)
+            coefficients = np.matmul(_FIT, values)
+            for i, start in enumerate(missing):
+                self._segments[start] = (int(e[i]), coefficients[i])
+
+        entries = [self._segments[start] for start in starts]
+        while len(self._segments) > max(self.max_segments, len(starts)):
+            del self._segments[next(iter(self._segments))]
+
+        # Chebyshev polynomials T_0..T_N-1 at every x: (M, N)
+        basis = np.empty((len(x), _NODES_PER_SEGMENT))
+        basis[:, 0] = 1.0
+        basis[:, 1] = x
+        for j in range(2, _NODES_PER_SEGMENT):
+            np.multiply(basis[:, j - 1], 2.0 * x, out=basis[:, j])
+            basis[:, j] -= basis[:, j - 2]
+
+        states = np.empty((len(x), 6))
+        e = np.zeros(len(x), dtype=np.uint8)
+        if len(entries) == 1 or np.all(segment[1:] >= segment[:-1]):
+            # Sorted offsets: one small matrix product per segment
+            bounds = np.searchsorted(segment, np.arange(len(entries) + 1))
+            for (code, coefficients), lo, hi in zip(entries, bounds[:-1].tolist(), bounds[1:].tolist()):
+                np.matmul(basis[lo:hi], coefficients, out=states[lo:hi])
+                e[lo:hi] = code
+        else:
+            coefficients = np.stack([entry[1] for entry in entries])
+            states[:] = np.einsum("mk,mkc->mc", basis, coefficients[segment])
+            e[:] = np.array([entry[0] for entry in entries], dtype=np.uint8)[segment]
+        return e, states[:, :3], states[:, 3:]
@@ -1,4 +1,6 @@
 import math
+import datetime
+import numpy as np
 import matplotlib.pyplot as plt
 from shannon.utils import BOLTZMANN, SPEED_OF_LIGHT, linear_to_db, db_to_linear, _DB_TO_LINEAR_EXP_FACTOR
 
@@ -22,7 +24,12 @@ def calculate_fspl(frequency, distance):
     Calculates Free Space Path Loss (FSPL) in dB.
     frequency: Hz
     distance: meters
+    Either argument may be a NumPy array, in which case the result is an array
+    broadcast over both (0 dB where distance or frequency is not positive).
     """
+    if isinstance(frequency, np.ndarray) or isinstance(distance, np.ndarray):
+        return _calculate_fspl_array(frequency, distance)
+
     if distance <= 0 or frequency <= 0:
         return 0.0
 
@@ -33,6 +40,21 @@ def calculate_fspl(frequency, distance):
     # over math.log10(d * f * C).
     return _LOG10_FACTOR_20 * math.log(distance * frequency) + _FSPL_LOG_CONSTANT
 
+def _calculate_fspl_array(frequency, distance):
+    """Vectorized calculate_fspl, using the same factored-log formula."""
+    frequency = np.asarray(frequency, dtype=np.float64)
+    distance = np.asarray(distance, dtype=np.float64)
+    valid = (distance > 0) & (frequency > 0)
+
+    # Optimization: one np.log over the product and in-place scaling, with the
+    # `where` mask skipping invalid points instead of evaluating and then patching them.
+    fspl = np.multiply(distance, frequency, out=np.empty(valid.shape))
+    np.log(fspl, out=fspl, where=valid)
+    fspl *= _LOG10_FACTOR_20
+    fspl += _FSPL_LOG_CONSTANT
+    fspl[~valid] = 0.0
+    return fspl
+
 class LinkBudget:
     def __init__(self, frequency, distance_km):
         self.frequency = frequency
@@ -108,6 +130,156 @@ class LinkBudget:
 
         return margin
 
+    def evaluate(self, distance_km=None, frequency=None, data_rate=None, required_eb_no=None,
+                 margin_db=3.0, atmosphere_loss=None, tx_power_dbm=None, tx_cable_loss=None,
+                 tx_antenna_gain=None, rx_antenna_gain=None, rx_noise_temp=None):
+        """
+        Vectorized link budget over arrays of design points.
+        distance_km, frequency (Hz), data_rate (bps), required_eb_no (dB) and
+        atmosphere_loss (dB) may be scalars or NumPy arrays and are broadcast against
+        each other, as may the transmitter and receiver parameters of set_transmitter()
+        and set_receiver(). Omitted values fall back to the configured ones and the
+        last required Eb/N0.
+        The LinkBudget itself is not modified.
+
+        Returns a dict of arrays:
+            fspl_db, c_n0_dbhz, max_data_rate (bps at the given margin_db)
+            and, when data_rate is given, eb_no_db and margin_db.
+        """
+        if distance_km is None:
+            distance_m = self.distance
+        else:
+            distance_m = np.multiply(distance_km, 1000.0)
+        if frequency is None:
+            frequency = self.frequency
+        if required_eb_no is None:
+            required_eb_no = self.last_required_eb_no
+        if atmosphere_loss is None:
+            atmosphere_loss = self.atmosphere_loss
+
+        fspl = _calculate_fspl_array(frequency, distance_m)
+
+        if tx_power_dbm is None:
+            tx_power_dbm = self.tx_power_dbm
+        if tx_cable_loss is None:
+            tx_cable_loss = self.tx_cable_loss
+        if tx_antenna_gain is None:
+            tx_antenna_gain = self.tx_antenna_gain
+        if rx_antenna_gain is None:
+            rx_antenna_gain = self.rx_antenna_gain
+        if rx_noise_temp is None:
+            rx_noise_temp = self.rx_noise_temp
+
+        # Everything except the path and atmosphere losses is usually a scalar for a
+        # given configuration, and then costs a single math.log
+        if np.ndim(rx_noise_temp) == 0:
+            n0_dbm_hz = _LOG10_FACTOR_10 * math.log(rx_noise_temp) + _N0_DBM_CONSTANT
+        else:
+            n0_dbm_hz = _LOG10_FACTOR_10 * np.log(rx_noise_temp) + _N0_DBM_CONSTANT
+        c_n0_constant = (
+            np.subtract(tx_power_dbm, tx_cable_loss) + tx_antenna_gain + rx_antenna_gain - n0_dbm_hz
+        )
+
+        # C/N0 = EIRP - FSPL - atmosphere + G_rx - N0
+        # Explicit `out` arrays keep 0-d inputs as arrays so the in-place steps below work.
+        c_n0 = np.subtract(c_n0_constant, fspl, out=np.empty(np.broadcast(c_n0_constant, fspl).shape))
+        if np.ndim(atmosphere_loss) == 0:
+            c_n0 -= atmosphere_loss
+        else:
+            c_n0 = c_n0 - atmosphere_loss
+
+        # R = 10^((C/N0 - target Eb/N0) / 10), via the faster natural exponential
+        target_eb_no = np.add(required_eb_no, margin_db)
+        max_rate = np.subtract(
+            c_n0, target_eb_no, out=np.empty(np.broadcast(c_n0, target_eb_no).shape)
+        )
+        max_rate *= _DB_TO_LINEAR_EXP_FACTOR
+        np.exp(max_rate, out=max_rate)
+
+        result = {
+            "fspl_db": fspl,
+            "c_n0_dbhz": c_n0,
+            "max_data_rate": max_rate,
+        }
+
+        if data_rate is not None:
+            data_rate = np.asarray(data_rate, dtype=np.float64)
+            # Eb/N0 = C/N0 - 10*log10(R), -inf for non-positive rates as in calculate_margin
+            log_rate = np.full(data_rate.shape, np.inf)
+            np.log(data_rate, out=log_rate, where=data_rate > 0)
+            eb_no = c_n0 - _LOG10_FACTOR_10 * log_rate
+            result["eb_no_db"] = eb_no
+            result["margin_db"] = eb_no - required_eb_no
+
+        return result
+
+    def atmosphere_loss_at(self, elevation, min_elevation=5.0):
+        """
+        Atmospheric loss (dB) at the given elevation(s) in degrees, treating the
+        configured atmosphere_loss as the zenith value and scaling it by the
+        cosecant law. Below min_elevation the loss is held constant, as the
+        cosecant diverges at the horizon.
+        """
+        sin_el = np.radians(np.maximum(np.asarray(elevation, dtype=np.float64), min_elevation))
+        if sin_el.ndim == 0:
+            return float(self.atmosphere_loss / np.sin(sin_el))
+        np.sin(sin_el, out=sin_el)
+        return np.divide(self.atmosphere_loss, sin_el, out=sin_el)
+
+    def evaluate_pass(self, pass_data, data_rate, required_eb_no=None, threshold_db=0.0,
+                      margin_db=3.0, min_elevation_for_loss=5.0):
+        """
+        Time-varying link budget along a pass, using the actual slant range.
+        pass_data: PassData with range_km and el arrays
+        data_rate: bps
+        threshold_db: link margin required for a sample to count as usable
+        margin_db: margin used for the per-sample max_data_rate
+        min_elevation_for_loss: elevation (deg) below which the atmospheric loss
+                                stops growing, as the cosecant law diverges at the horizon
+
+        The configured atmosphere_loss is treated as the zenith loss and scaled by
+        1 / sin(elevation) for every sample.
+
+        Returns a dict with the per-sample arrays of evaluate() plus:
+            atmosphere_loss_db: per-sample atmospheric loss
+            usable: boolean mask of samples with margin >= threshold_db
+            windows: list of (start, end) datetimes of the usable stretches
+            usable_seconds: total usable time
+            bits: data volume at data_rate over the usable windows
+            max_bits: data volume if the rate followed max_data_rate at every sample
+        """
+        atmosphere = self.atmosphere_loss_at(pass_data.el, min_elevation_for_loss)
+
+        result = self.evaluate(
+            distance_km=pass_data.range_km, data_rate=data_rate, required_eb_no=required_eb_no,
+            margin_db=margin_db, atmosphere_loss=atmosphere
+        )
+        result["atmosphere_loss_db"] = atmosphere
+
+        # Each sample stands for the time until the next one (or LOS for the last one)
+        durations = pass_data.durations
+
+        usable = result["margin_db"] >= threshold_db
+        result["usable"] = usable
+        result["usable_seconds"] = float(np.sum(durations[usable]))
+        result["bits"] = result["usable_seconds"] * data_rate
+        result["max_bits"] = float(np.dot(result["max_data_rate"], durations))
+
+        # Contiguous runs of usable samples
+        edges = np.diff(usable.astype(np.int8), prepend=0, append=0)
+        starts = np.where(edges == 1)[0].tolist()
+        stops = np.where(edges == -1)[0].tolist()
+        end_offsets = pass_data.offsets + durations
+        result["windows"] = [
+            (
+                pass_data.aos + datetime.timedelta(seconds=float(pass_data.offsets[i])),
+                pass_data.aos + datetime.timedelta(seconds=float(end_offsets[j - 1])),
+            )
+            for i, j in zip(starts, stops)
+        ]
+
+        return result
+
     def plot_waterfall(self):
         """Generates a waterfall chart of the link budget."""
         if not self.losses:
@@ -1,6 +1,45 @@
 import math
 import numpy as np
 
+# Information bits carried per symbol, uncoded
+BITS_PER_SYMBOL = {'BPSK': 1, 'QPSK': 2, '16-QAM': 4}
+
+# Theoretical BER of each scheme as a * erfc(b * sqrt(Eb/N0)), see ber_formula
+_BER_COEFFICIENTS = {
+    'BPSK': (0.5, 1.0),
+    'QPSK': (0.5, 1.0),
+    '16-QAM': (0.375, 0.6324555320336759),
+}
+
+
+def erfc(x):
+    """
+    Complementary error function over NumPy arrays (no SciPy dependency).
+    Chebyshev-fitted approximation (Numerical Recipes erfcc) with a fractional
+    error below 1.2e-7 everywhere, which keeps deep BER tails accurate.
+    """
+    z = np.abs(x, dtype=np.float64)
+    t = 1.0 / (1.0 + 0.5 * z)
+    # Horner evaluation of the fitted polynomial in t
+    poly = t * 0.17087277 - 0.82215223
+    for c in (1.48851587, -1.13520398, 0.27886807, -0.18628806,
+              0.09678418, 0.37409196, 1.00002368, -1.26551223):
+        poly *= t
+        poly += c
+    poly -= z * z
+    np.exp(poly, out=poly)
+    poly *= t
+    # erfc(-x) = 2 - erfc(x)
+    return np.where(np.asarray(x) >= 0, poly, 2.0 - poly)
+
+
+def _ber_coefficients(schemes):
+    try:
+        return np.array([_BER_COEFFICIENTS[s] for s in schemes], dtype=np.float64).T
+    except KeyError as e:
+        raise ValueError(f"Unknown modulation scheme: {e.args[0]}") from None
+
+
 class Modulation:
     # Precompute QPSK constellation points
     QPSK_SYMBOLS = np.exp(1j * (np.pi/4 + np.arange(4) * np.pi/2))
@@ -24,6 +63,14 @@ class Modulation:
     QAM16_SYMBOLS_REAL = QAM16_SYMBOLS.real
     QAM16_SYMBOLS_IMAG = QAM16_SYMBOLS.imag
 
+    # Gray-coded amplitude levels per real dimension, indexed by the bits on that axis.
+    # QPSK: one bit per axis, 0 -> -1/sqrt(2), 1 -> +1/sqrt(2)
+    GRAY_QPSK_LEVELS = np.array([-1.0, 1.0]) / math.sqrt(2)
+    # 16-QAM: two bits (b0 b1) per axis, index 2*b0 + b1: 00 -> -3, 01 -> -1, 11 -> +1, 10 -> +3
+    GRAY_QAM16_LEVELS = np.array([-3.0, -1.0, 3.0, 1.0]) / math.sqrt(10)
+    # 16-QAM decision threshold between inner and outer levels
+    _QAM16_THRESHOLD = 2.0 / math.sqrt(10)
+
     def __init__(self, scheme='BPSK', seed=None):
         self.scheme = scheme
         self.rng = np.random.default_rng(seed)
@@ -54,6 +101,156 @@ class Modulation:
         else:
             raise ValueError(f"Unknown modulation scheme: {self.scheme}")
 
+    def ber_array(self, eb_no_db):
+        """Vectorized ber_formula: BER for an array of Eb/N0 values (dB)."""
+        return self.ber_curves([self.scheme], eb_no_db)[0]
+
+    @staticmethod
+    def ber_curves(schemes, eb_no_db):
+        """
+        BER of several schemes over an array of Eb/N0 values (dB).
+        Returns a (len(schemes),) + eb_no_db.shape matrix.
+        """
+        a, b = _ber_coefficients(schemes)
+        eb_no_db = np.asarray(eb_no_db, dtype=np.float64)
+        shape = (len(schemes),) + (1,) * eb_no_db.ndim
+
+        # sqrt(10^(x/10)) == exp(x * ln(10)/20), as in ber_formula
+        arg = np.exp(eb_no_db * 0.1151292546497023) * b.reshape(shape)
+        ber = erfc(arg)
+        ber *= a.reshape(shape)
+        return ber
+
+    @staticmethod
+    def required_eb_no(schemes, target_ber, low=-10.0, high=40.0, tolerance_db=1e-6):
+        """
+        Eb/N0 (dB) at which each scheme's BER falls to target_ber, by bisection run
+        on all schemes and targets at once. target_ber may be a scalar or an array.
+        Returns a (len(schemes),) + target_ber.shape array. Raises ValueError when a
+        target lies outside [BER(high), BER(low)].
+        """
+        target_ber = np.asarray(target_ber, dtype=np.float64)
+        a, b = _ber_coefficients(schemes)
+        shape = (len(schemes),) + (1,) * target_ber.ndim
+        a = a.reshape(shape)
+        b = b.reshape(shape)
+
+        out_shape = (len(schemes),) + target_ber.shape
+        lo = np.full(out_shape, float(low))
+        hi = np.full(out_shape, float(high))
+
+        def ber(eb_no_db):
+            return a * erfc(b * np.exp(eb_no_db * 0.1151292546497023))
+
+        if np.any(ber(hi) > target_ber):
+            raise ValueError(f"Target BER not reachable below {high} dB Eb/N0")
+        if np.any(ber(lo) < target_ber):
+            raise ValueError(f"Target BER already met at {low} dB Eb/N0; lower low")
+
+        # BER decreases with Eb/N0; a fixed iteration count keeps every element in lockstep
+        iterations = max(int(math.ceil(math.log2((high - low) / tolerance_db))), 0)
+        for _ in range(iterations):
+            mid = 0.5 * (lo + hi)
+            above = ber(mid) > target_ber
+            np.copyto(lo, mid, where=above)
+            np.copyto(hi, mid, where=~above)
+        return hi
+
+    def modulate(self, bits):
+        """
+        Gray-maps a flat array of bits (0/1, length a multiple of the bits per symbol)
+        onto unit-energy complex symbols. For QPSK and 16-QAM the first half of each
+        symbol's bits select the I level and the second half the Q level.
+        """
+        k = BITS_PER_SYMBOL.get(self.scheme)
+        if k is None:
+            raise ValueError(f"Unknown modulation scheme: {self.scheme}")
+        bits = np.asarray(bits, dtype=np.int8)
+        num_symbols = len(bits) // k
+
+        out = np.empty(num_symbols, dtype=np.complex128)
+        out_float = out.view(np.float64).reshape(num_symbols, 2)
+        if self.scheme == 'BPSK':
+            out_float[:, 0] = self.BPSK_SYMBOLS_REAL[bits]
+            out_float[:, 1] = 0.0
+        elif self.scheme == 'QPSK':
+            out_float[:] = self.GRAY_QPSK_LEVELS[bits.reshape(num_symbols, 2)]
+        else:
+            pairs = bits.reshape(num_symbols, 2, 2)
+            out_float[:] = self.GRAY_QAM16_LEVELS[2 * pairs[..., 0] + pairs[..., 1]]
+        return out
+
+    def demodulate(self, iq):
+        """Hard-decision demodulation of complex symbols back to a flat int8 bit array."""
+        iq = np.ascontiguousarray(iq, dtype=np.complex128)
+        iq_float = iq.view(np.float64).reshape(len(iq), 2)
+
+        if self.scheme == 'BPSK':
+            return (iq_float[:, 0] > 0).view(np.int8)
+        elif self.scheme == 'QPSK':
+            return (iq_float > 0).view(np.int8).reshape(-1)
+        elif self.scheme == '16-QAM':
+            bits = np.empty((len(iq), 2, 2), dtype=np.bool_)
+            np.greater(iq_float, 0, out=bits[..., 0])
+            np.less(np.abs(iq_float), self._QAM16_THRESHOLD, out=bits[..., 1])
+            return bits.view(np.int8).reshape(-1)
+        else:
+            raise ValueError(f"Unknown modulation scheme: {self.scheme}")
+
+    def simulate_ber(self, eb_no_db, target_errors=100, max_bits=10**9, chunk_symbols=65536):
+        """
+        Monte Carlo BER at eb_no_db: random bits are Gray-mapped, passed through AWGN
+        and demodulated, chunk_symbols symbols at a time, until target_errors bit errors
+        have been counted or max_bits bits have been sent. Memory use is bounded by the
+        chunk size, whatever the number of bits simulated.
+
+        Returns a dict with ber, errors, bits and symbols.
+        """
+        k = BITS_PER_SYMBOL.get(self.scheme)
+        if k is None:
+            raise ValueError(f"Unknown modulation scheme: {self.scheme}")
+
+        # Es = 1, so Es/N0 = k * Eb/N0 and the noise std per dimension is sqrt(1 / (2 Es/N0))
+        noise_std = 0.7071067811865476 * math.exp(-(eb_no_db * 0.1151292546497023)) / math.sqrt(k)
+
+        # Optimization: the noise buffer is allocated once and refilled in place for every chunk
+        rx = np.empty(chunk_symbols, dtype=np.complex128)
+        errors = 0
+        bits_sent = 0
+
+        while errors < target_errors and bits_sent < max_bits:
+            num_symbols = min(chunk_symbols, -(-(max_bits - bits_sent) // k))
+            bits = self.rng.integers(0, 2, num_symbols * k, dtype=np.int8)
+
+            chunk = rx[:num_symbols]
+            chunk_float = chunk.view(np.float64)
+            self.rng.standard_normal(2 * num_symbols, out=chunk_float)
+            chunk_float *= noise_std
+            chunk += self.modulate(bits)
+
+            errors += int(np.count_nonzero(self.demodulate(chunk) != bits))
+            bits_sent += num_symbols * k
+
+        return {
+            'ber': errors / bits_sent if bits_sent else 0.0,
+            'errors': errors,
+            'bits': bits_sent,
+            'symbols': bits_sent // k,
+        }
+
+    def iter_iq(self, num_symbols, snr_db=10.0, block_symbols=65536):
+        """
+        Yields generate_iq() blocks of at most block_symbols symbols until num_symbols
+        have been produced, so arbitrarily long IQ streams use constant memory.
+        """
+        if self.scheme not in BITS_PER_SYMBOL:
+            raise ValueError(f"Unknown modulation scheme: {self.scheme}")
+        remaining = num_symbols
+        while remaining > 0:
+            n = min(block_symbols, remaining)
+            yield self.generate_iq(n, snr_db)
+            remaining -= n
+
     def generate_iq(self, num_symbols=1000, snr_db=10.0):
         """
         Generates random IQ points for the modulation scheme with noise.
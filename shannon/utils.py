@@ -4,6 +4,7 @@ import math
 BOLTZMANN = 1.380649e-23  # J/K
 SPEED_OF_LIGHT = 299792458  # m/s
 EARTH_RADIUS_KM = 6371.0  # km
+EARTH_ROTATION_RATE = 7.292115e-5  # rad/s (WGS84)
 
 # Precomputed factor for converting base-10 exponentiation to natural exponentiation
 # 10^(x/10) = e^(x * ln(10)/10)
@@ -15,6 +16,14 @@ def db_to_linear(db_value):
     # math.exp is significantly faster than base-10 exponentiation in Python.
     return math.exp(db_value * _DB_TO_LINEAR_EXP_FACTOR)
 
+def doppler_shift(frequency, range_rate_km_s):
+    """
+    Doppler shift in Hz of a carrier at `frequency` (Hz) for a range rate in km/s.
+    Delta f = -f * v_r / c, so an approaching satellite (v_r < 0) is shifted up.
+    Works element-wise on NumPy arrays.
+    """
+    return range_rate_km_s * (-1000.0 * frequency / SPEED_OF_LIGHT)
+
 def linear_to_db(linear_value):
     """Converts a linear value to dB scale."""
     import math
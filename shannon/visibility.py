@@ -0,0 +1,226 @@
+import math
+import numpy as np
+from shannon.utils import EARTH_ROTATION_RATE
+
+# Geometric visibility bounds used to skip propagation where no pass is possible.
+#
+# With theta the Earth central angle between the station and the sub-satellite
+# point, a satellite at radius r is above elevation e only if
+#     theta <= lambda(r) = arccos(R / r * cos(e)) - e
+# and lambda grows with r, so lambda at apogee bounds the footprint for the whole
+# orbit. theta changes no faster than the sub-satellite point moves over the
+# ground, which is bounded by the perigee angular rate plus the Earth's rotation.
+# All bounds are conservative: the prefilter may keep windows without a pass, but
+# never drops one.
+#
+# A pass shorter than the coarse scan step can fall between two nodes that are
+# both below the mask. The height u of the satellite above the station's horizon
+# plane has |u''| <= A, the bound on the satellite's acceleration in the rotating
+# frame (gravity at perigee plus Coriolis and centrifugal terms). From u and u' at
+# both ends of an interval, u stays below the parabolas u_i + u_i' t + A t^2 / 2
+# grown from either end, so the highest point of the lower one bounds u inside
+# the interval. Intervals where that bound clears the horizon and the elevation
+# rate turns from rising to setting may hold a hidden peak.
+
+# Smallest geocentric station radius (WGS84 polar radius), which maximizes lambda
+_MIN_EARTH_RADIUS_KM = 6356.752
+# Covers geodetic vs geocentric latitude and horizon (< 0.2 deg) and the short-period
+# SGP4 perturbations of inclination and apogee
+_ANGLE_MARGIN = math.radians(1.0)
+# Head-room on the Keplerian perigee rate for perturbations
+_RATE_MARGIN = 1.1
+
+# Head-room on the rotating-frame acceleration for J2 and drag
+_ACCELERATION_MARGIN = 1.1
+
+# Prefilter samples per orbit and bounds on the sample spacing (seconds). Sparser
+# samples cost less SGP4 but loosen the bound (the ground track moves further
+# between them); about 8 per orbit minimizes the nodes propagated in total.
+_PREFILTER_STEPS_PER_ORBIT = 8
+_MIN_PREFILTER_STEP_SECONDS = 60.0
+_MAX_PREFILTER_STEP_SECONDS = 2400.0
+
+
+def footprint_angle(satellite, min_elevation=0.0, station_alt_m=0.0):
+    """
+    Upper bound (rad) on the central angle between station and sub-satellite point
+    while the satellite is above min_elevation (deg), or None if the satellite
+    never rises that high.
+    """
+    r_apogee = (1.0 + satellite.alta) * satellite.radiusearthkm
+    r_station = _MIN_EARTH_RADIUS_KM + station_alt_m / 1000.0
+    eps = math.radians(min_elevation)
+    cos_arg = r_station / r_apogee * math.cos(eps)
+    if cos_arg >= 1.0:
+        return None
+    return math.acos(cos_arg) - eps + _ANGLE_MARGIN
+
+
+def can_be_visible(satellite, ground_station, min_elevation=0.0):
+    """
+    False when the station lies further from the equator than the ground track
+    (inclination, or 180 deg - inclination for retrograde orbits) reaches plus
+    the footprint, so the satellite can never rise above min_elevation there.
+    """
+    footprint = footprint_angle(satellite, min_elevation, ground_station.alt)
+    if footprint is None:
+        return False
+    inclination = math.degrees(satellite.inclo)
+    max_latitude = min(inclination, 180.0 - inclination)
+    return abs(ground_station.lat) <= max_latitude + math.degrees(footprint)
+
+
+def ground_track_rate(satellite):
+    """Upper bound (rad/s) on how fast the central angle to any station changes."""
+    n = satellite.no_kozai / 60.0
+    e = min(satellite.ecco, 0.99)
+    perigee_rate = n * math.sqrt(1.0 + e) / (1.0 - e) ** 1.5
+    return _RATE_MARGIN * perigee_rate + EARTH_ROTATION_RATE
+
+
+def up_acceleration_bound(satellite):
+    """Upper bound (km/s^2) on the acceleration of the satellite relative to any station."""
+    e = min(satellite.ecco, 0.99)
+    r_perigee = satellite.a * (1.0 - e) * satellite.radiusearthkm
+    r_apogee = satellite.a * (1.0 + e) * satellite.radiusearthkm
+    v_perigee = math.sqrt(satellite.mu * (1.0 + e) / r_perigee)
+    w = EARTH_ROTATION_RATE
+    gravity = satellite.mu / (r_perigee * r_perigee)
+    return _ACCELERATION_MARGIN * (gravity + 2.0 * w * (v_perigee + w * r_apogee) + w * w * r_apogee)
+
+
+def hidden_peaks(ground_station, r, v, jd, fr, offsets, visible, acceleration,
+                 min_elevation=0.0, rotation=None, intervals=None):
+    """
+    Which intervals between consecutive nodes, both not visible, may hold a pass
+    above min_elevation (deg) that starts and ends between them.
+    r, v: (..., K, 3) TEME positions and velocities at the offsets, jd/fr their Julian date
+    visible: (..., K) bool visibility of the nodes
+    acceleration: bound from up_acceleration_bound(), a scalar or an array
+                  broadcasting against r.shape[:-2] + (1,)
+    rotation: optional precomputed (cos, sin) of GMST at the nodes
+    intervals: optional (..., K - 1) mask of the intervals to check, e.g. excluding
+               those candidate_intervals() already ruled out
+    Returns a (..., K - 1) bool array.
+    """
+    cos_g, sin_g = ground_station._rotation(None, jd, fr, rotation)
+    x, y, z = ground_station._eci_to_ecef(r, rotation=(cos_g, sin_g))
+    up = ground_station.U_ecef
+    u = x * up[0]
+    u += y * up[1]
+    u += z * up[2]
+    u -= ground_station.C_up
+
+    h = np.diff(offsets)
+    peaks = ~visible[..., :-1]
+    peaks &= ~visible[..., 1:]
+    if intervals is not None:
+        peaks &= intervals
+    if min_elevation >= 0:
+        # Optimization: u - its chord stays within A h^2 / 8, which rules out
+        # nearly every interval before any rates are computed. (A negative mask
+        # is cleared below the horizon plane, so it keeps every interval.)
+        highest = np.maximum(u[..., :-1], u[..., 1:])
+        highest += acceleration * (0.125 * h * h)
+        peaks &= highest > 0
+    if not peaks.any():
+        return peaks
+
+    # Elevation rates at both ends of the remaining intervals only
+    index = np.nonzero(peaks)
+    ends = tuple(np.concatenate((i, i)) for i in index[:-1])
+    ends += (np.concatenate((index[-1], index[-1] + 1)),)
+    shape = r.shape[:-1]
+    u, u_rate, range_km, range_rate = ground_station.compute_up_rates(
+        r[ends], v[ends], None,
+        rotation=(np.broadcast_to(cos_g, shape)[ends], np.broadcast_to(sin_g, shape)[ends])
+    )
+    # Elevation rises at the start of the interval and sets at its end
+    rising = u_rate * range_km
+    rising -= u * range_rate
+    count = len(index[-1])
+    found = rising[:count] > 0
+    found &= rising[count:] <= 0
+
+    if min_elevation >= 0:
+        # The parabolas from either end cross once (their difference is linear in t);
+        # the bound on u inside the interval is their value there
+        h = np.broadcast_to(h, peaks.shape)[index]
+        a = np.broadcast_to(acceleration, peaks.shape)[index]
+        u0, u1 = u[:count], u[count:]
+        d0, d1 = u_rate[:count], u_rate[count:]
+        t = u1 - u0 - d1 * h + 0.5 * a * h * h
+        t /= d0 - d1 + a * h
+        np.clip(t, 0.0, h, out=t)
+        bound = np.minimum(u0 + d0 * t + 0.5 * a * t * t, u1 - d1 * (h - t) + 0.5 * a * (h - t) ** 2)
+        found &= bound > 0
+
+    peaks[index] = found
+    return peaks
+
+
+def prefilter_step(mean_motion):
+    """Prefilter sample spacing (seconds) for a mean motion in rad/min."""
+    if mean_motion <= 0:
+        return _MAX_PREFILTER_STEP_SECONDS
+    period_seconds = 2 * np.pi / mean_motion * 60.0
+    step = period_seconds / _PREFILTER_STEPS_PER_ORBIT
+    return float(round(min(max(step, _MIN_PREFILTER_STEP_SECONDS), _MAX_PREFILTER_STEP_SECONDS)))
+
+
+def prefilter_stride(mean_motion, coarse_step):
+    """Coarse nodes per prefilter sample, so the samples are about prefilter_step() apart."""
+    return max(int(round(prefilter_step(mean_motion) / coarse_step)), 1)
+
+
+def prefilter_samples(num_nodes, stride):
+    """Indices of every stride-th coarse node, always including the last."""
+    samples = np.arange(0, num_nodes, stride)
+    if samples[-1] != num_nodes - 1:
+        samples = np.append(samples, num_nodes - 1)
+    return samples
+
+
+def candidate_nodes(candidates, samples, num_nodes):
+    """
+    (..., num_nodes) mask of the coarse nodes to propagate: the samples, and every
+    node inside an interval between samples that may contain visibility, so runs
+    of candidate intervals become contiguous windows of kept nodes.
+    candidates: (..., len(samples) - 1) from candidate_intervals()
+    """
+    interval = np.searchsorted(samples, np.arange(num_nodes), side="right") - 1
+    np.minimum(interval, len(samples) - 2, out=interval)
+    keep = candidates[..., interval]
+    keep[..., samples] = True
+    return keep
+
+
+def candidate_intervals(ground_station, r, jd, fr, offsets, footprint, rate, rotation=None):
+    """
+    Which intervals between consecutive samples may contain visibility.
+    r: (..., K, 3) TEME positions at the sample offsets, jd/fr their Julian date
+    footprint, rate: bounds from footprint_angle() and ground_track_rate(),
+                     scalars or arrays broadcasting against r.shape[:-2] + (1,)
+    rotation: optional precomputed (cos, sin) of GMST at the samples
+    Returns a (..., K - 1) bool array.
+    """
+    rotation = ground_station._rotation(None, jd, fr, rotation)
+    x, y, z = ground_station._eci_to_ecef(r, rotation=rotation)
+
+    # cos(theta) between the station and sub-satellite directions
+    u = ground_station.location / np.linalg.norm(ground_station.location)
+    cos_theta = x * u[0]
+    cos_theta += y * u[1]
+    cos_theta += z * u[2]
+    cos_theta /= np.linalg.norm(r, axis=-1)
+    np.clip(cos_theta, -1.0, 1.0, out=cos_theta)
+    theta = np.arccos(cos_theta, out=cos_theta)
+    # Samples where SGP4 failed (NaN) are treated as possibly visible
+    theta[np.isnan(theta)] = 0.0
+
+    # Within an interval of length dt, theta can dip at most rate * dt below the
+    # straight line between its end samples
+    lowest = theta[..., :-1] + theta[..., 1:]
+    lowest -= np.diff(offsets) * rate
+    lowest *= 0.5
+    return lowest <= footprint
@@ -0,0 +1,75 @@
+import datetime
+import numpy as np
+import pytest
+from shannon.acm import ACMPlanner
+from shannon.link_budget import LinkBudget
+from shannon.orbits import PassData
+
+
+def _link():
+    link = LinkBudget(frequency=2.4e9, distance_km=600)
+    link.set_transmitter(power_dbm=30, cable_loss=1, antenna_gain=0)
+    link.add_path_loss(atmosphere_loss=0.5)
+    link.set_receiver(antenna_gain=15, noise_temp=150)
+    return link
+
+
+def _overhead_pass(aos, duration=600.0, zenith_km=600.0):
+    offsets = np.arange(0.0, duration, 10.0)
+    el = 90.0 * np.sin(np.pi * offsets / duration)
+    range_km = zenith_km / np.maximum(np.sin(np.radians(el)), 0.2)
+    return PassData(aos, aos + datetime.timedelta(seconds=duration), 90.0, offsets,
+                    np.zeros_like(offsets), el, range_km)
+
+
+def test_plan_picks_fastest_closing_scheme():
+    link = _link()
+    planner = ACMPlanner(link, symbol_rate=2e4, target_ber=1e-5)
+    pass_data = _overhead_pass(datetime.datetime(2024, 1, 1, 12, 0, 0))
+
+    plan = planner.plan_pass(pass_data)
+    index = plan["scheme_index"]
+
+    # Throughput climbs towards zenith and falls again
+    peak = np.argmax(pass_data.el)
+    assert np.all(np.diff(index[:peak + 1]) >= 0)
+    assert np.all(np.diff(index[peak:]) <= 0)
+    assert index[peak] == len(planner.schemes) - 1 and index[0] == -1
+
+    # Every chosen scheme closes, and the next faster one would not
+    atmosphere = link.atmosphere_loss_at(pass_data.el)
+    for i, k in enumerate(index):
+        if k >= 0:
+            result = link.evaluate(distance_km=pass_data.range_km[i], atmosphere_loss=atmosphere[i],
+                                   data_rate=planner.bit_rates[k], required_eb_no=planner.required_eb_no[k])
+            assert result["margin_db"] >= 0.0
+        if k + 1 < len(planner.schemes):
+            result = link.evaluate(distance_km=pass_data.range_km[i], atmosphere_loss=atmosphere[i],
+                                   data_rate=planner.bit_rates[k + 1], required_eb_no=planner.required_eb_no[k + 1])
+            assert result["margin_db"] < 0.0
+
+    assert plan["bits"] == pytest.approx(np.sum(plan["rate_bps"] * pass_data.durations))
+
+
+def test_schedule_plan_matches_per_pass():
+    planner = ACMPlanner(_link(), symbol_rate=2e4, target_ber=1e-6)
+    start = datetime.datetime(2024, 1, 1, 12, 0, 0)
+    passes = [
+        _overhead_pass(start, 600.0, 600.0),
+        _overhead_pass(start + datetime.timedelta(hours=2), 420.0, 1000.0),
+        _overhead_pass(start + datetime.timedelta(hours=4), 300.0, 2000.0),
+    ]
+
+    plan = planner.plan(passes)
+    assert plan["bits"].shape == (3,)
+    for i, p in enumerate(passes):
+        single = planner.plan_pass(p)
+        assert plan["bits"][i] == pytest.approx(single["bits"])
+        assert np.array_equal(plan["scheme_index"][i], single["scheme_index"])
+    assert plan["total_bits"] == pytest.approx(plan["bits"].sum())
+    assert plan["bits"][0] > plan["bits"][1] > plan["bits"][2]
+
+
+def test_unknown_scheme_rejected():
+    with pytest.raises(ValueError, match="8-PSK.*supported: BPSK"):
+        ACMPlanner(_link(), symbol_rate=2e4, schemes=("BPSK", "8-PSK"))
@@ -0,0 +1,88 @@
+import datetime
+from fastapi.testclient import TestClient
+from api import index
+from api.index import app
+
+client = TestClient(app)
+
+TLE_LINE1 = "1 25544U 98067A   23345.67890123  .00012345  00000-0  12345-3 0  9999"
+TLE_LINE2 = "2 25544  51.6416 123.4567 0001234 123.4567 321.4567 15.54321098123456"
+MEO_LINE1 = "1 24876U 97035A   23345.50000000  .00000000  00000-0  00000-0 0  9990"
+MEO_LINE2 = "2 24876  55.5000 100.0000 0050000  50.0000 310.0000  2.00560000190000"
+
+
+def _budget(**overrides):
+    budget = {
+        "frequency": 2.4e9, "distance_km": 600.0, "tx_power_dbm": 30.0, "tx_cable_loss": 1.0,
+        "tx_antenna_gain": 0.0, "atmosphere_loss": 0.5, "rx_antenna_gain": 15.0,
+        "rx_noise_temp": 150.0, "data_rate": 9600.0, "required_eb_no": 10.0,
+    }
+    budget.update(overrides)
+    return budget
+
+
+def test_link_budget_batch_matches_single_calls():
+    budgets = [_budget(), _budget(distance_km=2000.0, frequency=437e6), _budget(rx_noise_temp=500.0, data_rate=1e6)]
+    res = client.post("/api/calculate-link-budget/batch", json={"requests": budgets})
+    assert res.status_code == 200
+    results = res.json()["results"]
+    assert len(results) == 3
+
+    for budget, result in zip(budgets, results):
+        single = client.post("/api/calculate-link-budget", json=budget).json()
+        assert abs(result["margin_db"] - single["margin_db"]) < 1e-9
+        for (name, value), (single_name, single_value) in zip(result["losses"], single["losses"]):
+            assert name == single_name and abs(value - single_value) < 1e-9
+
+    # Columnar input gives the same answers
+    columns = {field: [b[field] for b in budgets] for field in budgets[0]}
+    res = client.post("/api/calculate-link-budget/batch", json={"columns": columns})
+    assert res.json()["results"] == results
+
+
+def test_link_budget_batch_validation():
+    assert client.post("/api/calculate-link-budget/batch", json={}).status_code == 400
+    columns = {field: [value] for field, value in _budget().items()}
+    columns["data_rate"] = [1.0, 2.0]
+    assert client.post("/api/calculate-link-budget/batch", json={"columns": columns}).status_code == 400
+
+    res = client.post("/api/calculate-link-budget/batch", json={"requests": [_budget(data_rate=0.0)]})
+    assert res.json()["results"][0]["margin_db"] is None
+
+
+def test_pass_batch_matches_single_calls(monkeypatch):
+    # Pin "now" so the batch and single searches share their start time
+    monkeypatch.setattr(index, "_utcnow", lambda: datetime.datetime(2023, 12, 12, 12, 0, 0))
+    requests = [
+        {"tle_line1": TLE_LINE1, "tle_line2": TLE_LINE2, "lat": 59.35, "lon": 18.07, "alt": 0.0},
+        {"tle_line1": TLE_LINE1, "tle_line2": TLE_LINE2, "lat": -33.9, "lon": 18.4, "alt": 0.0},
+        {"tle_line1": TLE_LINE1, "tle_line2": TLE_LINE2, "lat": 59.35, "lon": 18.07, "alt": 0.0,
+         "max_duration_hours": 0.01},
+        # MEO passes last hours: returned whole, or cut at the request's own limit
+        {"tle_line1": MEO_LINE1, "tle_line2": MEO_LINE2, "lat": 59.35, "lon": 18.07, "alt": 0.0},
+        {"tle_line1": MEO_LINE1, "tle_line2": MEO_LINE2, "lat": 59.35, "lon": 18.07, "alt": 0.0,
+         "max_duration_hours": 3.0},
+    ]
+    res = client.post("/api/predict-pass/batch", json={"requests": requests})
+    assert res.status_code == 200
+    results = res.json()["results"]
+    assert len(results) == len(requests)
+
+    assert results[2] == {"message": "No pass found within duration."}
+    for request, result in zip(requests, results):
+        single = client.post("/api/predict-pass", json=request).json()
+        if "message" in single:
+            assert result == single
+            continue
+        for key in ("aos", "los"):
+            delta = datetime.datetime.fromisoformat(result[key]) - datetime.datetime.fromisoformat(single[key])
+            assert abs(delta.total_seconds()) < 0.2
+        assert abs(result["max_el"] - single["max_el"]) < 0.01
+        assert len(result["points"]) == len(single["points"])
+
+    meo_hours = [
+        (datetime.datetime.fromisoformat(r["los"]) - datetime.datetime.fromisoformat(r["aos"])).total_seconds() / 3600
+        for r in results[3:]
+    ]
+    assert meo_hours[0] > 3.0
+    assert results[4]["los"] == "2023-12-12T15:00:00"
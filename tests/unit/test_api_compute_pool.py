@@ -0,0 +1,91 @@
+import asyncio
+import threading
+import pytest
+from fastapi import HTTPException
+from api.index import _ComputePool
+
+
+def test_pool_runs_jobs_and_applies_backpressure():
+    async def scenario():
+        pool = _ComputePool(max_workers=1, max_queued=1, timeout=5.0)
+        release = threading.Event()
+
+        running = asyncio.ensure_future(pool.run(release.wait))
+        queued = asyncio.ensure_future(pool.run(lambda: 42))
+        await asyncio.sleep(0.05)
+        assert pool.pending == 2
+
+        # One worker busy and one job queued: the next request is rejected
+        with pytest.raises(HTTPException) as excinfo:
+            await pool.run(lambda: 0)
+        assert excinfo.value.status_code == 429
+
+        release.set()
+        assert await running is True
+        assert await queued == 42
+        await asyncio.sleep(0.05)
+        assert pool.pending == 0
+
+    asyncio.run(scenario())
+
+
+def test_pool_times_out_but_keeps_slot_until_job_ends():
+    async def scenario():
+        pool = _ComputePool(max_workers=1, max_queued=0, timeout=0.05)
+        release = threading.Event()
+
+        with pytest.raises(HTTPException) as excinfo:
+            await pool.run(release.wait)
+        assert excinfo.value.status_code == 504
+
+        # The timed out job still occupies the only worker
+        assert pool.pending == 1
+        with pytest.raises(HTTPException) as excinfo:
+            await pool.run(lambda: 0)
+        assert excinfo.value.status_code == 429
+
+        release.set()
+        await asyncio.sleep(0.05)
+        assert pool.pending == 0
+        assert await pool.run(lambda: 7) == 7
+
+    asyncio.run(scenario())
+
+
+def test_stream_holds_a_slot_until_it_ends():
+    async def scenario():
+        pool = _ComputePool(max_workers=1, max_queued=0, timeout=5.0)
+        chunks = iter([b"a", b"b"])
+        stream = await pool.stream(lambda: next(chunks, None))
+        assert pool.pending == 1
+
+        # The open stream occupies the only slot
+        with pytest.raises(HTTPException) as excinfo:
+            await pool.stream(lambda: None)
+        assert excinfo.value.status_code == 429
+
+        assert [chunk async for chunk in stream] == [b"a", b"b"]
+        assert pool.pending == 0
+
+        # An error in the first chunk is raised at once and frees the slot
+        with pytest.raises(ValueError):
+            await pool.stream(lambda: int("x"))
+        assert pool.pending == 0
+
+    asyncio.run(scenario())
+
+
+def test_slot_released_after_event_loop_closes():
+    pool = _ComputePool(max_workers=1, max_queued=0, timeout=0.05)
+    release = threading.Event()
+
+    async def scenario():
+        with pytest.raises(HTTPException):
+            await pool.run(release.wait)
+
+    asyncio.run(scenario())
+    # The job finishes after its event loop is gone
+    assert pool.pending == 1
+    release.set()
+    pool._executor.submit(lambda: None).result(timeout=5.0)
+    assert pool.pending == 0
@@ -0,0 +1,68 @@
+import numpy as np
+from fastapi.testclient import TestClient
+from api import index
+from api.index import app
+
+client = TestClient(app)
+
+
+def test_stream_matches_generate_iq():
+    res = client.post("/api/generate-iq/stream", json={
+        "scheme": "QPSK", "snr_db": 100.0, "num_symbols": 2500,
+        "block_symbols": 1000, "dtype": "float64",
+    })
+    assert res.status_code == 200
+    assert res.headers["content-type"] == "application/octet-stream"
+    assert res.headers["x-iq-dtype"] == "<f8"
+
+    iq = np.frombuffer(res.content, dtype="<f8")
+    assert iq.shape == (5000,)
+    # Noise-free QPSK points sit at +-1/sqrt(2) on each axis
+    assert np.allclose(np.abs(iq), 1 / np.sqrt(2), atol=1e-4)
+
+
+def test_framed_float32_stream():
+    res = client.post("/api/generate-iq/stream", json={
+        "scheme": "16-QAM", "snr_db": 20.0, "num_symbols": 2500,
+        "block_symbols": 1000, "framed": True,
+    })
+    assert res.status_code == 200
+    payload = res.content
+
+    counts = []
+    offset = 0
+    while offset < len(payload):
+        n = int(np.frombuffer(payload, dtype="<u4", count=1, offset=offset)[0])
+        offset += 4
+        block = np.frombuffer(payload, dtype="<f4", count=2 * n, offset=offset)
+        offset += block.nbytes
+        counts.append(n)
+    assert counts == [1000, 1000, 500]
+
+
+def test_stream_rejects_bad_requests():
+    assert client.post("/api/generate-iq/stream", json={"scheme": "8-PSK", "snr_db": 10.0}).status_code == 400
+    assert client.post("/api/generate-iq/stream", json={"scheme": "BPSK", "snr_db": 10.0, "dtype": "int16"}).status_code == 400
+    for num_symbols, block_symbols in ((0, 1000), (-1, 1000), (10, 0)):
+        res = client.post("/api/generate-iq/stream", json={
+            "scheme": "BPSK", "snr_db": 10.0, "num_symbols": num_symbols, "block_symbols": block_symbols,
+        })
+        assert res.status_code == 400
+        assert "must be positive" in res.json()["error"]
+
+
+def test_stream_respects_compute_pool_limit(monkeypatch):
+    pool = index._ComputePool(max_workers=1, max_queued=0, timeout=5.0)
+    monkeypatch.setattr(index, "COMPUTE_POOL", pool)
+    request = {"scheme": "BPSK", "snr_db": 10.0, "num_symbols": 2500, "block_symbols": 1000}
+
+    pool._acquire()  # another request holds the only slot
+    res = client.post("/api/generate-iq/stream", json=request)
+    assert res.status_code == 429
+    assert res.headers["retry-after"] == "1"
+
+    pool._release()
+    res = client.post("/api/generate-iq/stream", json=request)
+    assert res.status_code == 200
+    assert len(res.content) == 2500 * 2 * 4
+    assert pool.pending == 0
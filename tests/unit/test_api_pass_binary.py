@@ -0,0 +1,79 @@
+import datetime
+import io
+import json
+import numpy as np
+from fastapi.testclient import TestClient
+from api.index import app, _pass_to_dict, _passes_response
+from shannon.orbits import PassData
+
+client = TestClient(app)
+
+TLE_LINE1 = "1 25544U 98067A   23345.67890123  .00012345  00000-0  12345-3 0  9999"
+TLE_LINE2 = "2 25544  51.6416 123.4567 0001234 123.4567 321.4567 15.54321098123456"
+
+
+def _synthetic_pass(aos, n=40, step=30.0):
+    offsets = np.arange(n) * step
+    el = 80.0 * np.sin(np.pi * offsets / offsets[-1])
+    return PassData(aos, aos + datetime.timedelta(seconds=float(offsets[-1])), float(el.max()),
+                    offsets, np.linspace(10.0, 200.0, n), el, 2000.0 - 15.0 * el)
+
+
+def _decode(payload):
+    header = np.frombuffer(payload, dtype=[("magic", "S4"), ("version", "<u2"), ("reserved", "<u2"),
+                                            ("count", "<u4"), ("reserved2", "<u4")], count=1)[0]
+    assert header["magic"] == b"SHNP" and header["version"] == 1
+    offset = 16
+    passes = []
+    for _ in range(header["count"]):
+        aos, los, step = np.frombuffer(payload, dtype="<f8", count=3, offset=offset)
+        max_el = np.frombuffer(payload, dtype="<f4", count=1, offset=offset + 24)[0]
+        n = int(np.frombuffer(payload, dtype="<u4", count=1, offset=offset + 28)[0])
+        columns = np.frombuffer(payload, dtype="<f4", count=3 * n, offset=offset + 32).reshape(3, n)
+        offset += 32 + columns.nbytes
+        passes.append((aos, los, step, max_el, columns))
+    assert offset == len(payload)
+    return passes
+
+
+def test_binary_payload_roundtrip():
+    aos = datetime.datetime(2024, 1, 1, 12, 0, 0)
+    passes = [_synthetic_pass(aos), _synthetic_pass(aos + datetime.timedelta(hours=2), n=25, step=10.0)]
+
+    decoded = _decode(_passes_response(passes, "application/octet-stream").body)
+    assert len(decoded) == 2
+    for p, (aos_s, los_s, step, max_el, columns) in zip(passes, decoded):
+        assert aos_s == p.aos.replace(tzinfo=datetime.timezone.utc).timestamp()
+        assert los_s == p.los.replace(tzinfo=datetime.timezone.utc).timestamp()
+        assert step == p.offsets[1] - p.offsets[0]
+        assert abs(max_el - p.max_el) < 1e-4
+        assert np.allclose(columns, [p.az, p.el, p.range_km], rtol=1e-6)
+
+    # Several times smaller than the JSON points
+    json_size = len(json.dumps([_pass_to_dict(p) for p in passes]))
+    assert json_size > 5 * len(_passes_response(passes, "application/octet-stream").body)
+
+
+def test_npy_payload_roundtrip():
+    p = _synthetic_pass(datetime.datetime(2024, 1, 1, 12, 0, 0))
+    buffer = io.BytesIO(_passes_response([p], "application/x-npy").body)
+    meta = np.load(buffer)
+    columns = np.load(buffer)
+    assert meta[2] == 30.0 and columns.shape == (3, len(p)) and columns.dtype == np.float32
+    assert np.allclose(columns[1], p.el, rtol=1e-6)
+
+
+def test_pass_endpoints_negotiate_binary():
+    body = {"tle_line1": TLE_LINE1, "tle_line2": TLE_LINE2, "lat": 59.35, "lon": 18.07, "alt": 0.0}
+
+    res = client.post("/api/predict-passes", json=body, headers={"Accept": "application/octet-stream"})
+    assert res.status_code == 200
+    assert res.headers["content-type"] == "application/octet-stream"
+    assert len(_decode(res.content)) > 0
+
+    res = client.post("/api/predict-pass", json=body, headers={"Accept": "application/octet-stream"})
+    assert len(_decode(res.content)) == 1
+
+    # JSON stays the default
+    res = client.post("/api/predict-pass", json=body)
+    assert "points" in res.json()
@@ -1,5 +1,7 @@
+import math
+import numpy as np
 import pytest
-from shannon.modulation import Modulation
+from shannon.modulation import Modulation, erfc
 
 def test_ber_bpsk():
     mod = Modulation('BPSK')
@@ -13,3 +15,45 @@ def test_ber_qpsk():
     mod = Modulation('QPSK')
     ber = mod.ber_formula(0.0)
     assert abs(ber - 0.0786) < 0.001
+
+def test_erfc_matches_math():
+
+    x = np.linspace(-3.0, 8.0, 221)
+    expected = np.array([math.erfc(v) for v in x])
+    assert np.all(np.abs(erfc(x) - expected) <= 1.2e-7 * expected)
+
+def test_ber_curves_match_scalar():
+
+    schemes = ['BPSK', 'QPSK', '16-QAM']
+    eb_no = np.linspace(-5.0, 15.0, 41)
+    curves = Modulation.ber_curves(schemes, eb_no)
+    assert curves.shape == (3, 41)
+    for i, scheme in enumerate(schemes):
+        mod = Modulation(scheme)
+        expected = np.array([mod.ber_formula(x) for x in eb_no])
+        assert np.allclose(curves[i], expected, rtol=2e-7, atol=0)
+        assert np.array_equal(mod.ber_array(eb_no), curves[i])
+
+    with pytest.raises(ValueError):
+        Modulation.ber_curves(['8-PSK'], eb_no)
+
+def test_required_eb_no_inverts_ber():
+
+    targets = np.array([1e-3, 1e-5, 1e-7])
+    eb_no = Modulation.required_eb_no(['BPSK', '16-QAM'], targets)
+    assert eb_no.shape == (2, 3)
+    # BPSK reaches 1e-5 at about 9.6 dB; 16-QAM needs more for the same BER
+    assert abs(eb_no[0, 1] - 9.59) < 0.01
+    assert np.all(eb_no[1] > eb_no[0])
+    assert np.all(np.diff(eb_no, axis=1) > 0)
+    for i, scheme in enumerate(['BPSK', '16-QAM']):
+        ber = Modulation(scheme).ber_array(eb_no[i])
+        assert np.allclose(ber, targets, rtol=1e-5)
+
+    with pytest.raises(ValueError):
+        Modulation.required_eb_no(['BPSK'], 1e-300, high=10.0)
+    # BPSK BER at -10 dB is ~0.33, so 0.4 lies above the bracket
+    with pytest.raises(ValueError):
+        Modulation.required_eb_no(['BPSK'], 0.4)
+    with pytest.raises(ValueError):
+        Modulation.required_eb_no(['BPSK'], [1e-5, 0.4])
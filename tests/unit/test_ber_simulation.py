@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+from shannon.modulation import Modulation
+
+SCHEMES = ['BPSK', 'QPSK', '16-QAM']
+
+
+@pytest.mark.parametrize('scheme', SCHEMES)
+def test_modulate_demodulate_roundtrip(scheme):
+    mod = Modulation(scheme, seed=1)
+    bits = mod.rng.integers(0, 2, 4000, dtype=np.int8)
+    symbols = mod.modulate(bits)
+    # Unit average symbol energy
+    assert abs(np.mean(np.abs(symbols) ** 2) - 1.0) < 0.05
+    assert np.array_equal(mod.demodulate(symbols), bits)
+
+
+def test_qam16_levels_are_gray_coded():
+    # Neighbouring amplitude levels differ in exactly one bit
+    levels = Modulation.GRAY_QAM16_LEVELS
+    order = np.argsort(levels)
+    for a, b in zip(order[:-1], order[1:]):
+        assert bin(a ^ b).count('1') == 1
+
+
+@pytest.mark.parametrize('scheme, eb_no_db', [('BPSK', 4.0), ('QPSK', 4.0), ('16-QAM', 8.0)])
+def test_simulated_ber_matches_formula(scheme, eb_no_db):
+    mod = Modulation(scheme, seed=7)
+    result = mod.simulate_ber(eb_no_db, target_errors=4000, chunk_symbols=8192)
+    assert result['errors'] >= 4000
+    assert abs(result['ber'] - mod.ber_formula(eb_no_db)) < 0.1 * mod.ber_formula(eb_no_db)
+
+
+def test_simulation_stops_at_max_bits_and_is_reproducible():
+    a = Modulation('16-QAM', seed=3).simulate_ber(20.0, target_errors=10, max_bits=100_001, chunk_symbols=1000)
+    b = Modulation('16-QAM', seed=3).simulate_ber(20.0, target_errors=10, max_bits=100_001, chunk_symbols=1000)
+    assert a == b
+    # Whole symbols only: 100_001 bits round up to 25_001 symbols
+    assert a['symbols'] == 25_001 and a['bits'] == 100_004
+    assert a['errors'] < 10
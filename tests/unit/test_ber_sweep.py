@@ -0,0 +1,41 @@
+import pytest
+from shannon.ber_sweep import simulate_ber_sweep
+from shannon.modulation import Modulation
+
+
+def _sweep(max_workers):
+    return simulate_ber_sweep(
+        ['BPSK', '16-QAM'], [2.0, 6.0], seed=42, max_workers=max_workers,
+        target_errors=200, rel_tolerance=0.2, job_symbols=4096, chunk_symbols=1024
+    )
+
+
+def test_sweep_is_independent_of_worker_count():
+    serial = _sweep(1)
+    parallel = _sweep(2)
+    assert serial == parallel
+    assert len(serial) == 2 and len(serial[0]) == 2
+
+
+def test_sweep_stops_once_interval_converges():
+    results = _sweep(1)
+    for row in results:
+        for point in row:
+            assert point['errors'] >= 200
+            assert point['ci_high'] - point['ber'] <= 0.2 * point['ber']
+            assert point['ci_low'] <= point['ber'] <= point['ci_high']
+            assert point['bits'] == point['jobs'] * 4096 * (1 if point['scheme'] == 'BPSK' else 4)
+            expected = Modulation(point['scheme']).ber_formula(point['eb_no_db'])
+            assert abs(point['ber'] - expected) < 0.25 * expected
+
+    # Points with fewer errors per job need more jobs to converge
+    assert results[0][1]['jobs'] > results[0][0]['jobs']
+
+
+def test_sweep_respects_bit_budget():
+    result = simulate_ber_sweep(['QPSK'], 12.0, seed=1, max_workers=1, target_errors=1000,
+                                max_bits=3 * 2 * 1000, job_symbols=1000)[0][0]
+    assert result['jobs'] == 3 and result['bits'] == 6000
+
+    with pytest.raises(ValueError):
+        simulate_ber_sweep(['8-PSK'], 0.0, max_workers=1)
@@ -0,0 +1,79 @@
+import datetime
+import time
+import numpy as np
+from shannon.cache import LRUCache, EphemerisCache, parse_tle, propagate_nodes
+from shannon.orbits import PassPredictor
+from shannon.ground_station import GroundStation
+
+TLE_LINE1 = "1 25544U 98067A   23345.67890123  .00012345  00000-0  12345-3 0  9999"
+TLE_LINE2 = "2 25544  51.6416 123.4567 0001234 123.4567 321.4567 15.54321098123456"
+
+
+def test_lru_cache_eviction_and_memory_cap():
+    cache = LRUCache(maxsize=2, max_bytes=100)
+    cache.put("a", 1, nbytes=10)
+    cache.put("b", 2, nbytes=10)
+    assert cache.get("a") == 1  # "a" is now most recently used
+    cache.put("c", 3, nbytes=10)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+    # Exceeding the memory cap evicts the least recently used entries
+    cache.put("d", 4, nbytes=95)
+    assert len(cache) == 1
+    assert cache.nbytes == 95
+
+    # Entries larger than the whole budget are not cached
+    cache.put("e", 5, nbytes=101)
+    assert cache.get("e") is None
+
+
+def test_lru_cache_ttl():
+    cache = LRUCache(ttl=0.01)
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+    time.sleep(0.02)
+    assert cache.get("a") is None
+
+
+def test_parse_tle_reuses_satrec():
+    assert parse_tle(TLE_LINE1, TLE_LINE2) is parse_tle(TLE_LINE1, TLE_LINE2)
+
+
+def test_ephemeris_cache_matches_direct_propagation():
+    satellite = parse_tle(TLE_LINE1, TLE_LINE2)
+    cache = EphemerisCache(chunk_nodes=16)
+
+    # Spans several chunks and starts mid-chunk
+    e1, r1, v1 = cache.propagate_nodes(satellite, "iss", 60.0, 12_345_670, 40)
+    e2, r2, v2 = propagate_nodes(satellite, 60.0, 12_345_670, 40)
+    np.testing.assert_array_equal(e1, e2)
+    np.testing.assert_allclose(r1, r2)
+    np.testing.assert_allclose(v1, v2)
+    misses = cache.misses
+
+    # An overlapping request is served entirely from the cache
+    cache.propagate_nodes(satellite, "iss", 60.0, 12_345_680, 20)
+    assert cache.misses == misses
+    assert cache.hits > 0
+
+
+def test_pass_predictor_with_cache_matches_uncached():
+    station = GroundStation(37.7749, -122.4194, 0)
+    start_time = datetime.datetime(2023, 12, 12, 12, 0, 0)
+    end_time = start_time + datetime.timedelta(hours=24)
+
+    cache = EphemerisCache()
+    expected = PassPredictor(TLE_LINE1, TLE_LINE2).get_passes(station, start_time, end_time)
+
+    for offset_minutes in (0, 7):
+        predictor = PassPredictor(TLE_LINE1, TLE_LINE2, ephemeris_cache=cache)
+        shifted = start_time + datetime.timedelta(minutes=offset_minutes)
+        passes = predictor.get_passes(station, shifted, end_time)
+        assert len(passes) == len(expected)
+        for p, q in zip(passes[1:], expected[1:]):
+            assert abs((p.aos - q.aos).total_seconds()) < 0.2
+            assert abs((p.los - q.los).total_seconds()) < 0.2
+
+    # The second, overlapping window reused the chunks of the first
+    assert cache.hits > 0
@@ -0,0 +1,62 @@
+import datetime
+import numpy as np
+from sgp4.propagation import gstime
+from shannon import earth_rotation
+from shannon.ground_station import GroundStation
+from shannon.orbits import PassPredictor
+
+ISS = ("1 25544U 98067A   23345.67890123  .00012345  00000-0  12345-3 0  9999",
+       "2 25544  51.6416 123.4567 0001234 123.4567 321.4567 15.54321098123456")
+
+
+def _angle_difference(a, b):
+    return np.abs(np.angle(np.exp(1j * (np.asarray(a) - np.asarray(b)))))
+
+
+def test_gmst_matches_sgp4_gstime():
+    jd = 2460291.0
+    fr = np.linspace(0.0, 3.0, 500)
+    expected = [gstime(jd + f) for f in fr.tolist()]
+    assert _angle_difference(earth_rotation.gmst(jd, fr), expected).max() < 1e-8
+    assert _angle_difference(earth_rotation.gmst(jd, 0.25), gstime(jd + 0.25)) < 1e-8
+    # GroundStation uses the same model
+    np.testing.assert_array_equal(GroundStation._calculate_gmst(None, jd, fr), earth_rotation.gmst(jd, fr))
+
+
+def test_eop_file_applies_ut1_utc(tmp_path):
+    # One IERS finals2000A style line (fixed columns) and plain "MJD UT1-UTC" lines
+    finals = " " * 7 + f"{60290.00:8.2f}" + " " * 42 + "I" + f"{-0.0100000:10.7f}" + " " * 20 + "\n"
+    path = tmp_path / "eop.txt"
+    path.write_text("# MJD UT1-UTC\n" + finals + "60291.0, 0.0200000\n60292.0 0.0300000\n")
+
+    jd, fr = 2460291.0, 0.0  # MJD 60290.5
+    before = earth_rotation.gmst(jd, fr)
+    try:
+        assert earth_rotation.load_eop(str(path)) == 3
+        assert abs(earth_rotation.ut1_utc(jd, fr) - 0.005) < 1e-12
+        assert abs(earth_rotation.ut1_utc(jd + 10, fr) - 0.03) < 1e-12
+        # UT1 ahead of UTC by 5 ms advances GMST by 5 ms of Earth rotation
+        shift = earth_rotation.gmst(jd, fr) - before
+        assert abs(shift - 0.005 * 2 * np.pi * 1.0027379 / 86400.0) < 1e-10
+    finally:
+        earth_rotation.set_eop(None, None)
+    assert earth_rotation.gmst(jd, fr) == before
+
+
+def test_grid_rotation_shared_across_stations():
+    earth_rotation.ROTATION_CACHE.clear()
+    predictor = PassPredictor(*ISS)
+    start = datetime.datetime(2023, 12, 12, 12, 0, 0)
+    stations = [GroundStation(59.35, 18.07, 10), GroundStation(37.77, -122.42, 0)]
+    passes = [predictor.get_passes(station, start, start + datetime.timedelta(hours=12)) for station in stations]
+    assert any(passes)
+    # The second station reuses the first station's table
+    assert earth_rotation.ROTATION_CACHE.misses == 1
+    assert earth_rotation.ROTATION_CACHE.hits == 1
+
+    cos_g, sin_g = earth_rotation.grid_rotation(2460291.0, 0.125, 60.0, 100)
+    assert not cos_g.flags.writeable
+    assert earth_rotation.grid_rotation(2460291.0, 0.125, 60.0, 100)[0] is cos_g
+    expected = earth_rotation.gmst(2460291.0, 0.125 + np.arange(100) * 60.0 / 86400.0)
+    np.testing.assert_allclose(cos_g, np.cos(expected), atol=1e-12)
+    np.testing.assert_allclose(sin_g, np.sin(expected), atol=1e-12)
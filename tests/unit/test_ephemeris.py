@@ -0,0 +1,65 @@
+import datetime
+import numpy as np
+import pytest
+from shannon.ephemeris import EphemerisStore
+from shannon.orbits import PassPredictor
+from shannon.ground_station import GroundStation
+
+TLES = [
+    ("1 25544U 98067A   23345.67890123  .00012345  00000-0  12345-3 0  9999",
+     "2 25544  51.6416 123.4567 0001234 123.4567 321.4567 15.54321098123456"),
+    ("1 33591U 09005A   20265.56828552  .00000055  00000-0  57632-4 0  9995",
+     "2 33591  99.1989 123.6338 0013952 147.2885 212.9238 14.12351659595519"),
+]
+
+START = datetime.datetime(2023, 12, 12, 12, 0, 0)
+
+
+@pytest.fixture
+def store(tmp_path):
+    EphemerisStore.write(tmp_path, TLES, START, START + datetime.timedelta(hours=30), step_seconds=60.0)
+    # Reopen as a reader would
+    return EphemerisStore(tmp_path)
+
+
+def test_store_matches_sgp4(store):
+    assert store.ids == ["25544", "33591"]
+    assert store.r.shape == (2, 30 * 60 + 1, 3)
+
+    predictor = PassPredictor(*TLES[1])
+    t = START + datetime.timedelta(minutes=90)
+    e, r, v = predictor.satellite.sgp4(*predictor.get_julian_date(t))
+    np.testing.assert_allclose(store.r[1, 90], r)
+    np.testing.assert_allclose(store.v[1, 90], v)
+
+
+def test_slice_is_zero_copy_and_aligned(store):
+    sl = store.slice("25544", START + datetime.timedelta(seconds=90), START + datetime.timedelta(hours=2))
+
+    # Rounded up to the next stored sample
+    assert sl.start_time == START + datetime.timedelta(minutes=2)
+    assert sl.end_time == START + datetime.timedelta(hours=2)
+    assert len(sl) == 119
+    assert np.shares_memory(sl.r, store.r)
+    assert not sl.r.flags.writeable
+
+
+def test_look_angles_and_passes_from_slice(store):
+    station = GroundStation(37.7749, -122.4194, 0)
+    sl = store.slice("25544", START, START + datetime.timedelta(hours=24))
+
+    az, el, range_km = station.compute_look_angles(sl, None)
+    az2, el2, range_km2 = station.compute_look_angles(np.asarray(sl.r), None, jd=sl.jd, fr=sl.fr)
+    np.testing.assert_allclose(el, el2)
+
+    predictor = store.predictor("25544")
+    passes = predictor.get_passes_from_ephemeris(station, sl)
+    expected = predictor.get_passes(station, sl.start_time, sl.end_time)
+    assert len(passes) == len(expected) > 0
+    for p, q in zip(passes, expected):
+        assert abs((p.aos - q.aos).total_seconds()) < 0.2
+        assert abs((p.los - q.los).total_seconds()) < 0.2
+
+    # A predictor for another TLE must not consume this ephemeris
+    with pytest.raises(ValueError):
+        PassPredictor(*TLES[1]).get_passes_from_ephemeris(station, sl)
@@ -0,0 +1,75 @@
+import datetime
+from shannon.forecast import forecast_passes
+from shannon.orbits import PassPredictor
+from shannon.ground_station import GroundStation
+
+TLES = [
+    ("1 25544U 98067A   23345.67890123  .00012345  00000-0  12345-3 0  9999",
+     "2 25544  51.6416 123.4567 0001234 123.4567 321.4567 15.54321098123456"),
+    ("1 33591U 09005A   20265.56828552  .00000055  00000-0  57632-4 0  9995",
+     "2 33591  99.1989 123.6338 0013952 147.2885 212.9238 14.12351659595519"),
+]
+
+STATIONS = [(37.7749, -122.4194, 0), (59.3498, 18.0707, 10)]
+
+
+def test_forecast_matches_single_window_search():
+    """Windowed, parallel forecast returns the same passes as one get_passes call."""
+    start_time = datetime.datetime(2023, 12, 12, 12, 0, 0)
+    end_time = start_time + datetime.timedelta(hours=48)
+
+    results = forecast_passes(
+        TLES, STATIONS, start_time, end_time, max_workers=2, window_hours=6.0, chunk_size=3
+    )
+
+    assert len(results) == len(TLES)
+    for (line1, line2), per_station in zip(TLES, results):
+        assert len(per_station) == len(STATIONS)
+        predictor = PassPredictor(line1, line2)
+        for (lat, lon, alt), passes in zip(STATIONS, per_station):
+            expected = predictor.get_passes(GroundStation(lat, lon, alt), start_time, end_time)
+            assert len(passes) == len(expected)
+            for p, q in zip(passes, expected):
+                assert abs((p.aos - q.aos).total_seconds()) < 0.2
+                assert abs((p.los - q.los).total_seconds()) < 0.2
+
+
+def test_forecast_is_independent_of_worker_count():
+    start_time = datetime.datetime(2023, 12, 12, 12, 0, 0)
+    end_time = start_time + datetime.timedelta(hours=24)
+
+    serial = forecast_passes(TLES, STATIONS, start_time, end_time, max_workers=1, window_hours=8.0)
+    parallel = forecast_passes(TLES, STATIONS, start_time, end_time, max_workers=2, window_hours=8.0)
+
+    serial_aos = [[[p.aos for p in passes] for passes in sat] for sat in serial]
+    parallel_aos = [[[p.aos for p in passes] for passes in sat] for sat in parallel]
+    assert serial_aos == parallel_aos
+
+
+def test_forecast_returns_long_meo_and_geo_passes_whole():
+    """Passes lasting several windows are followed to their LOS, not cut at a fixed overlap."""
+    meo = ("1 24876U 97035A   23345.50000000  .00000000  00000-0  00000-0 0  9990",
+           "2 24876  55.5000 100.0000 0050000  50.0000 310.0000  2.00560000190000")
+    geo = ("1 41866U 16071A   23345.50000000 -.00000100  00000-0  00000-0 0  9990",
+           "2 41866   0.0500 100.0000 0001000  50.0000 310.0000  1.00270000 25000")
+    stations = [(59.3498, 18.0707, 10), (37.7749, -122.4194, 0)]
+    start_time = datetime.datetime(2023, 12, 12, 23, 30, 0)
+    end_time = start_time + datetime.timedelta(hours=48)
+
+    results = forecast_passes([meo, geo], stations, start_time, end_time, max_workers=1, window_hours=6.0)
+
+    longest = datetime.timedelta(0)
+    for (line1, line2), per_station in zip([meo, geo], results):
+        predictor = PassPredictor(line1, line2)
+        for (lat, lon, alt), passes in zip(stations, per_station):
+            expected = predictor.get_passes(GroundStation(lat, lon, alt), start_time, end_time)
+            assert len(passes) == len(expected)
+            for p, q in zip(passes, expected):
+                assert abs((p.aos - q.aos).total_seconds()) < 0.2
+                assert abs((p.los - q.los).total_seconds()) < 0.2
+                assert abs(p.max_el - q.max_el) < 1e-6
+                longest = max(longest, p.los - p.aos)
+    # MEO passes of ~6 h, and the GEO satellite in view over San Francisco throughout
+    assert results[0][0] and results[1][1]
+    assert results[1][1][0].los - results[1][1][0].aos == end_time - start_time
+    assert longest > datetime.timedelta(hours=6)
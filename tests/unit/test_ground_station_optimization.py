@@ -1,7 +1,7 @@
 
 import pytest
 import numpy as np
-from shannon.ground_station import GroundStation
+from shannon.ground_station import GroundStation, GroundStationNetwork
 
 def test_compute_look_angles_optimization_correctness():
     """
@@ -90,3 +90,82 @@ def test_pass_predictor_consistency():
         assert not np.isnan(p['el'])
         assert not np.isnan(p['range_km'])
         assert p['el'] > 0
+
+def test_compute_look_angles_batched_satellites():
+    """
+    Verifies that (N, T, 3) positions for N satellites sharing one time grid
+    give the same results as N separate (T, 3) calls, on both paths.
+    """
+    gs = GroundStation(59.3498, 18.0707, 10)
+
+    np.random.seed(7)
+    N, T = 4, 500
+    r = np.random.randn(N, T, 3) * 7000.0
+    jd = 2459000.5
+    fr = np.linspace(0, 0.1, T)
+
+    for mask_invisible in (False, True):
+        az, el, rng = gs.compute_look_angles(r, None, jd=jd, fr=fr, mask_invisible=mask_invisible)
+        assert az.shape == (N, T)
+
+        for i in range(N):
+            az_i, el_i, rng_i = gs.compute_look_angles(r[i], None, jd=jd, fr=fr, mask_invisible=mask_invisible)
+            np.testing.assert_allclose(az[i], az_i)
+            np.testing.assert_allclose(el[i], el_i)
+            np.testing.assert_allclose(rng[i], rng_i)
+
+def test_ground_station_network_matches_single_stations():
+    """
+    Verifies that the stacked (stations x times) kernel matches evaluating
+    each GroundStation separately, on both the masked and unmasked paths.
+    """
+    stations = [
+        GroundStation(59.3498, 18.0707, 10),
+        GroundStation(-33.8688, 151.2093, 50),
+        GroundStation(0.0, 0.0, 0),
+        GroundStation(78.2232, 15.6267, 400),
+    ]
+    network = GroundStationNetwork(stations)
+
+    np.random.seed(3)
+    N = 1000
+    r = np.random.randn(N, 3) * 7000.0
+    jd = 2459000.5
+    fr = np.linspace(0, 0.1, N)
+
+    for mask_invisible in (False, True):
+        az, el, rng = network.compute_look_angles(r, None, jd=jd, fr=fr, mask_invisible=mask_invisible)
+        assert az.shape == (len(stations), N)
+
+        for i, gs in enumerate(stations):
+            az_i, el_i, rng_i = gs.compute_look_angles(r, None, jd=jd, fr=fr, mask_invisible=mask_invisible)
+            np.testing.assert_allclose(az[i], az_i)
+            np.testing.assert_allclose(el[i], el_i)
+            np.testing.assert_allclose(rng[i], rng_i)
+
+def test_range_rate_matches_finite_difference():
+    """
+    Verifies compute_range_rate from SGP4 velocities against a central
+    difference of the range.
+    """
+    from sgp4.api import Satrec
+
+    gs = GroundStation(59.3498, 18.0707, 10)
+    line1 = "1 25544U 98067A   20164.51268519  .00001614  00000-0  37389-4 0  9998"
+    line2 = "2 25544  51.6442 209.3090 0002626  63.5076 250.2989 15.49479383231362"
+    sat = Satrec.twoline2rv(line1, line2)
+
+    dt = 0.5  # seconds
+    fr = np.linspace(0.1, 0.2, 200)
+    jd = np.full(len(fr), 2459013.5)
+    _, r, v = sat.sgp4_array(jd, fr)
+    _, r_plus, _ = sat.sgp4_array(jd, fr + dt / 86400.0)
+    _, r_minus, _ = sat.sgp4_array(jd, fr - dt / 86400.0)
+
+    range_rate = gs.compute_range_rate(r, v, None, jd=jd[0], fr=fr)
+
+    _, _, range_plus = gs.compute_look_angles(r_plus, None, jd=jd[0], fr=fr + dt / 86400.0)
+    _, _, range_minus = gs.compute_look_angles(r_minus, None, jd=jd[0], fr=fr - dt / 86400.0)
+    expected = (range_plus - range_minus) / (2 * dt)
+
+    np.testing.assert_allclose(range_rate, expected, atol=1e-4)
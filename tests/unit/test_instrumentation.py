@@ -0,0 +1,66 @@
+import contextvars
+import threading
+from fastapi.testclient import TestClient
+from api.index import app
+from shannon import instrumentation
+from shannon.instrumentation import span
+
+TLE_LINE1 = "1 25544U 98067A   23345.67890123  .00012345  00000-0  12345-3 0  9999"
+TLE_LINE2 = "2 25544  51.6416 123.4567 0001234 123.4567 321.4567 15.54321098123456"
+
+
+def test_spans_are_no_ops_while_disabled():
+    instrumentation.disable()
+    instrumentation.REGISTRY.clear()
+    with instrumentation.collect() as timings:
+        with span("stage"):
+            pass
+    assert timings == {} and instrumentation.REGISTRY.histograms == {}
+
+
+def test_spans_feed_histograms_and_collectors():
+    instrumentation.enable()
+    instrumentation.REGISTRY.clear()
+    try:
+        with instrumentation.collect() as timings:
+            for _ in range(3):
+                with span("stage"):
+                    pass
+            # Spans in a thread running a copy of the context land in the same collector
+            def worker():
+                with span("worker"):
+                    pass
+            thread = threading.Thread(target=contextvars.copy_context().run, args=(worker,))
+            thread.start()
+            thread.join()
+
+        assert set(timings) == {"stage", "worker"}
+        histogram = instrumentation.REGISTRY.histograms["stage"]
+        assert histogram.count == 3 and sum(histogram.counts) == 3
+
+        text = instrumentation.render_prometheus()
+        assert 'shannon_stage_duration_seconds_count{stage="stage"} 3' in text
+        assert 'shannon_stage_duration_seconds_bucket{stage="stage",le="+Inf"} 3' in text
+    finally:
+        instrumentation.disable()
+
+
+def test_api_server_timing_and_metrics():
+    client = TestClient(app)
+    body = {"tle_line1": TLE_LINE1, "tle_line2": TLE_LINE2, "lat": 59.35, "lon": 18.07, "alt": 0.0}
+
+    assert "server-timing" not in client.post("/api/predict-pass", json=body).headers
+
+    instrumentation.enable()
+    instrumentation.REGISTRY.clear()
+    try:
+        res = client.post("/api/predict-pass", json=body)
+        timing = res.headers["server-timing"]
+        for stage in ("sgp4", "look_angles", "pass_search", "serialize", "total"):
+            assert f"{stage};dur=" in timing
+
+        metrics = client.get("/api/metrics")
+        assert metrics.headers["content-type"].startswith("text/plain")
+        assert 'stage="pass_search"' in metrics.text and 'stage="request"' in metrics.text
+    finally:
+        instrumentation.disable()
@@ -0,0 +1,70 @@
+import datetime
+import numpy as np
+from sgp4.api import Satrec, jday
+from shannon.ground_station import GroundStation
+from shannon.interpolation import ChebyshevEphemeris, error_bound, segment_seconds
+from shannon.orbits import PassPredictor
+
+ISS = ("1 25544U 98067A   23345.67890123  .00012345  00000-0  12345-3 0  9999",
+       "2 25544  51.6416 123.4567 0001234 123.4567 321.4567 15.54321098123456")
+MOLNIYA = ("1 28163U 04005A   23345.50000000  .00000100  00000-0  00000-0 0  9990",
+           "2 28163  63.4000 100.0000 7000000 270.0000  10.0000  2.00600000 90000")
+
+START = datetime.datetime(2023, 12, 12, 12, 0, 0)
+STATION = GroundStation(37.7749, -122.4194, 0)
+
+
+def test_interpolation_error_within_bound():
+    jd, fr = jday(2023, 12, 12, 12, 0, 0)
+    offsets = np.arange(0.0, 43200.0, 0.7)
+    for tle in (ISS, MOLNIYA):
+        satellite = Satrec.twoline2rv(*tle)
+
+        def propagate(o):
+            return satellite.sgp4_array(np.full(len(o), jd), fr + o / 86400.0)
+
+        length = segment_seconds(satellite, 1e-3)
+        position_bound, velocity_bound = error_bound(satellite, length)
+        assert position_bound <= 1e-3
+
+        ephemeris = ChebyshevEphemeris(propagate, length)
+        _, r, v = ephemeris(offsets)
+        _, r_exact, v_exact = propagate(offsets)
+        assert np.abs(r - r_exact).max() <= position_bound
+        assert np.abs(v - v_exact).max() <= velocity_bound
+        # An order of magnitude fewer SGP4 calls than samples
+        assert ephemeris.sgp4_calls * 10 < len(offsets)
+
+
+def test_interpolated_pass_points_match_sgp4():
+    exact = PassPredictor(*ISS)
+    interpolated = PassPredictor(*ISS, interpolation_tolerance_km=1e-3)
+    end = START + datetime.timedelta(hours=12)
+
+    expected = exact.get_passes(STATION, START, end, step_seconds=1, carrier_frequency=437e6)
+    actual = interpolated.get_passes(STATION, START, end, step_seconds=1, carrier_frequency=437e6)
+    assert len(actual) == len(expected) > 0
+    for a, b in zip(actual, expected):
+        assert a.aos == b.aos and a.los == b.los
+        # 1 m at > 400 km range is well below 1e-3 deg
+        np.testing.assert_allclose(a.el, b.el, atol=1e-3)
+        np.testing.assert_allclose(a.az, b.az, atol=1e-3)
+        np.testing.assert_allclose(a.range_km, b.range_km, atol=1e-3)
+        np.testing.assert_allclose(a.doppler_hz, b.doppler_hz, atol=0.1)
+
+
+def test_interpolated_track_matches_linear_nodes():
+    exact = PassPredictor(*ISS)
+    interpolated = PassPredictor(*ISS, interpolation_tolerance_km=1e-3)
+    pass_data = exact.get_next_pass(STATION, START)
+
+    kwargs = dict(rate_hz=10, block_seconds=5.0, carrier_frequency=437e6)
+    expected = list(exact.track(STATION, pass_data.aos, pass_data.los, **kwargs))
+    actual = list(interpolated.track(STATION, pass_data.aos, pass_data.los, **kwargs))
+    assert len(actual) == len(expected)
+    # The reference interpolates linearly between 1 s nodes, itself ~1 m off
+    np.testing.assert_allclose([s["el"] for s in actual], [s["el"] for s in expected], atol=2e-3)
+    np.testing.assert_allclose([s["az"] for s in actual], [s["az"] for s in expected], atol=2e-3)
+    np.testing.assert_allclose(
+        [s["doppler_hz"] for s in actual], [s["doppler_hz"] for s in expected], atol=1.0
+    )
@@ -1,5 +1,9 @@
+import datetime
+import math
+import numpy as np
 import pytest
 from shannon.link_budget import calculate_fspl, LinkBudget
+from shannon.orbits import PassData
 
 def test_fspl_accuracy():
     """Verifies Free Space Path Loss calculation against standard."""
@@ -26,3 +30,78 @@ def test_link_margin():
 
     assert margin > 14.0
     assert margin < 16.0
+
+def test_vectorized_evaluate_matches_scalar():
+
+    link = LinkBudget(frequency=2.4e9, distance_km=600)
+    link.set_transmitter(power_dbm=30, cable_loss=1, antenna_gain=0)
+    link.add_path_loss(atmosphere_loss=0.5)
+    link.set_receiver(antenna_gain=15, noise_temp=150)
+
+    distances = np.array([500.0, 1000.0, 2500.0])[:, None]
+    frequencies = np.array([437e6, 2.4e9])[None, :]
+    result = link.evaluate(distance_km=distances, frequency=frequencies, data_rate=9600, required_eb_no=10.0)
+
+    assert result["margin_db"].shape == (3, 2)
+    for i, d in enumerate(distances[:, 0]):
+        for j, f in enumerate(frequencies[0]):
+            scalar = LinkBudget(frequency=f, distance_km=d)
+            scalar.set_transmitter(power_dbm=30, cable_loss=1, antenna_gain=0)
+            scalar.add_path_loss(atmosphere_loss=0.5)
+            scalar.set_receiver(antenna_gain=15, noise_temp=150)
+            assert abs(result["margin_db"][i, j] - scalar.calculate_margin(9600, 10.0)) < 1e-9
+            assert abs(result["max_data_rate"][i, j] - scalar.max_data_rate(3.0, 10.0)) < 1e-6 * scalar.max_data_rate(3.0, 10.0)
+            assert abs(result["fspl_db"][i, j] - calculate_fspl(f, d * 1000)) < 1e-9
+
+def test_fspl_array_handles_invalid_points():
+
+    loss = calculate_fspl(frequency=np.array([2.4e9, 2.4e9, 0.0]), distance=np.array([100e3, -1.0, 100e3]))
+    assert abs(loss[0] - 140.05) < 0.1
+    assert loss[1] == 0.0 and loss[2] == 0.0
+
+def test_evaluate_pass_windows_and_volume():
+
+    link = LinkBudget(frequency=2.4e9, distance_km=600)
+    link.set_transmitter(power_dbm=30, cable_loss=1, antenna_gain=0)
+    link.add_path_loss(atmosphere_loss=0.5)
+    link.set_receiver(antenna_gain=15, noise_temp=150)
+
+    # Synthetic overhead pass: long range near the horizon, 600 km at zenith
+    aos = datetime.datetime(2024, 1, 1, 12, 0, 0)
+    offsets = np.arange(0.0, 600.0, 10.0)
+    el = 90.0 * np.sin(np.pi * offsets / 600.0)
+    range_km = 600.0 / np.maximum(np.sin(np.radians(el)), 0.2)
+    pass_data = PassData(aos, aos + datetime.timedelta(seconds=600), 90.0, offsets,
+                         np.zeros_like(offsets), el, range_km)
+
+    result = link.evaluate_pass(pass_data, data_rate=1e5, required_eb_no=10.0, threshold_db=0.0)
+
+    # Per-sample values match the scalar budget at the same range and scaled atmosphere loss
+    i = 30
+    scalar = LinkBudget(frequency=2.4e9, distance_km=range_km[i])
+    scalar.set_transmitter(power_dbm=30, cable_loss=1, antenna_gain=0)
+    scalar.add_path_loss(atmosphere_loss=0.5 / np.sin(np.radians(el[i])))
+    scalar.set_receiver(antenna_gain=15, noise_temp=150)
+    assert abs(result["margin_db"][i] - scalar.calculate_margin(1e5, 10.0)) < 1e-9
+
+    # The link closes around zenith only: one window, centred on the pass
+    assert len(result["windows"]) == 1
+    start, end = result["windows"][0]
+    assert aos < start < aos + datetime.timedelta(seconds=300) < end < aos + datetime.timedelta(seconds=600)
+    assert result["usable_seconds"] == (end - start).total_seconds()
+    assert result["bits"] == result["usable_seconds"] * 1e5
+    assert np.all(result["margin_db"][result["usable"]] >= 0.0)
+
+
+def test_atmosphere_loss_at_scalar_and_list():
+    link = LinkBudget(2e9, 1000)
+    link.add_path_loss(atmosphere_loss=0.5)
+
+    loss = link.atmosphere_loss_at(30.0)
+    assert isinstance(loss, float)
+    assert loss == pytest.approx(1.0)
+    # Below min_elevation the loss is held at its min_elevation value
+    assert link.atmosphere_loss_at(2.0) == pytest.approx(0.5 / math.sin(math.radians(5.0)))
+
+    losses = link.atmosphere_loss_at([90.0, 30.0])
+    assert losses.tolist() == pytest.approx([0.5, 1.0])
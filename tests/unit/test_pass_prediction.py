@@ -1,6 +1,8 @@
 import unittest
+import asyncio
 import datetime
-from shannon.orbits import PassPredictor
+import numpy as np
+from shannon.orbits import PassPredictor, ConstellationPredictor
 from shannon.ground_station import GroundStation
 
 class TestPassPrediction(unittest.TestCase):
@@ -17,10 +19,206 @@ class TestPassPrediction(unittest.TestCase):
         pass_data = predictor.get_next_pass(station, start_time, max_duration_hours=24)
 
         self.assertIsNotNone(pass_data)
-        self.assertEqual(pass_data.aos, datetime.datetime(2023, 12, 12, 12, 5, 30))
-        self.assertEqual(pass_data.los, datetime.datetime(2023, 12, 12, 12, 15, 30))
-        self.assertAlmostEqual(pass_data.max_el, 18.020339782587794, places=4)
+        # AOS/LOS are refined to the horizon crossing inside the 30 s grid cells
+        # found by the original fixed-step search (first visible step 12:05:30,
+        # last visible step 12:15:00).
+        self.assertGreater(pass_data.aos, datetime.datetime(2023, 12, 12, 12, 5, 0))
+        self.assertLessEqual(pass_data.aos, datetime.datetime(2023, 12, 12, 12, 5, 30))
+        self.assertGreaterEqual(pass_data.los, datetime.datetime(2023, 12, 12, 12, 15, 0))
+        self.assertLess(pass_data.los, datetime.datetime(2023, 12, 12, 12, 15, 30))
+        self.assertAlmostEqual(pass_data.max_el, 18.02, delta=0.1)
         self.assertEqual(len(pass_data.points), 20)
 
+    def test_aos_los_refined_to_horizon(self):
+        tle_line1 = "1 25544U 98067A   23345.67890123  .00012345  00000-0  12345-3 0  9999"
+        tle_line2 = "2 25544  51.6416 123.4567 0001234 123.4567 321.4567 15.54321098123456"
+
+        station = GroundStation(37.7749, -122.4194, 0)
+        predictor = PassPredictor(tle_line1, tle_line2)
+
+        start_time = datetime.datetime(2023, 12, 12, 12, 0, 0)
+        end_time = start_time + datetime.timedelta(hours=24)
+
+        for min_elevation in (0.0, 10.0):
+            passes = predictor.get_passes(station, start_time, end_time, min_elevation=min_elevation)
+            self.assertGreater(len(passes), 0)
+
+            for p in passes:
+                for t in (p.aos, p.los):
+                    jd, fr = predictor.get_julian_date(t)
+                    _, r, _ = predictor.satellite.sgp4(jd, fr)
+                    _, el, _ = station.compute_look_angles(np.array(r), t)
+                    # 0.1 s of motion is well under 0.01 deg of elevation for LEO
+                    self.assertAlmostEqual(el, min_elevation, delta=0.01)
+                self.assertGreater(p.max_el, min_elevation)
+
+    def test_get_passes_returns_all_passes(self):
+        tle_line1 = "1 25544U 98067A   23345.67890123  .00012345  00000-0  12345-3 0  9999"
+        tle_line2 = "2 25544  51.6416 123.4567 0001234 123.4567 321.4567 15.54321098123456"
+
+        station = GroundStation(37.7749, -122.4194, 0)
+        predictor = PassPredictor(tle_line1, tle_line2)
+
+        start_time = datetime.datetime(2023, 12, 12, 12, 0, 0)
+        end_time = start_time + datetime.timedelta(hours=24)
+
+        passes = predictor.get_passes(station, start_time, end_time)
+
+        # An ISS-like orbit passes over a mid-latitude station several times a day
+        self.assertGreater(len(passes), 1)
+
+        # The first pass matches get_next_pass
+        first = predictor.get_next_pass(station, start_time, max_duration_hours=24)
+        self.assertEqual(passes[0].aos, first.aos)
+        self.assertEqual(passes[0].los, first.los)
+        self.assertEqual(len(passes[0].points), len(first.points))
+
+        # Passes are ordered, disjoint and inside the window
+        for prev, nxt in zip(passes, passes[1:]):
+            self.assertLess(prev.los, nxt.aos)
+        for p in passes:
+            self.assertGreaterEqual(p.aos, start_time)
+            self.assertLessEqual(p.los, end_time)
+            self.assertGreater(p.max_el, 0)
+
+    def test_constellation_matches_individual_predictors(self):
+        tles = [
+            ("1 25544U 98067A   23345.67890123  .00012345  00000-0  12345-3 0  9999",
+             "2 25544  51.6416 123.4567 0001234 123.4567 321.4567 15.54321098123456"),
+            ("1 33591U 09005A   20265.56828552  .00000055  00000-0  57632-4 0  9995",
+             "2 33591  99.1989 123.6338 0013952 147.2885 212.9238 14.12351659595519"),
+        ]
+
+        station = GroundStation(37.7749, -122.4194, 0)
+        start_time = datetime.datetime(2023, 12, 12, 12, 0, 0)
+        end_time = start_time + datetime.timedelta(hours=24)
+
+        results = ConstellationPredictor(tles, batch_size=1).get_passes(station, start_time, end_time)
+        self.assertEqual(len(results), len(tles))
+
+        for (line1, line2), passes in zip(tles, results):
+            expected = PassPredictor(line1, line2).get_passes(station, start_time, end_time)
+            self.assertEqual(len(passes), len(expected))
+            for p, q in zip(passes, expected):
+                # The shared coarse grid may differ, but refinement converges to the same crossing
+                self.assertAlmostEqual((p.aos - q.aos).total_seconds(), 0.0, delta=0.2)
+                self.assertAlmostEqual((p.los - q.los).total_seconds(), 0.0, delta=0.2)
+
+    def test_pass_data_columns_and_points_view(self):
+        tle_line1 = "1 25544U 98067A   23345.67890123  .00012345  00000-0  12345-3 0  9999"
+        tle_line2 = "2 25544  51.6416 123.4567 0001234 123.4567 321.4567 15.54321098123456"
+
+        station = GroundStation(37.7749, -122.4194, 0)
+        predictor = PassPredictor(tle_line1, tle_line2)
+        start_time = datetime.datetime(2023, 12, 12, 12, 0, 0)
+
+        pass_data = predictor.get_next_pass(station, start_time, max_duration_hours=24, step_seconds=10)
+
+        # Columns are aligned float64 arrays, evenly spaced from AOS
+        self.assertEqual(pass_data.az.dtype, np.float64)
+        self.assertEqual(len(pass_data.el), len(pass_data.offsets))
+        self.assertEqual(pass_data.offsets[0], 0.0)
+        np.testing.assert_allclose(np.diff(pass_data.offsets), 10.0)
+        self.assertLessEqual(pass_data.offsets[-1], (pass_data.los - pass_data.aos).total_seconds())
+
+        # The lazy per-point view agrees with the columns
+        points = pass_data.points
+        self.assertIs(points, pass_data.points)
+        self.assertEqual(len(points), len(pass_data))
+        self.assertEqual(points[0]["time"], pass_data.aos)
+        self.assertEqual(points[3]["time"], pass_data.aos + datetime.timedelta(seconds=30))
+        self.assertEqual(points[3]["el"], pass_data.el[3])
+
+    def test_pass_doppler_s_curve(self):
+        tle_line1 = "1 25544U 98067A   23345.67890123  .00012345  00000-0  12345-3 0  9999"
+        tle_line2 = "2 25544  51.6416 123.4567 0001234 123.4567 321.4567 15.54321098123456"
+
+        station = GroundStation(37.7749, -122.4194, 0)
+        predictor = PassPredictor(tle_line1, tle_line2)
+        start_time = datetime.datetime(2023, 12, 12, 12, 0, 0)
+
+        pass_data = predictor.get_next_pass(station, start_time, carrier_frequency=437e6)
+
+        # Approaching at AOS (shifted up), receding at LOS (shifted down)
+        self.assertEqual(pass_data.carrier_frequency, 437e6)
+        self.assertLess(pass_data.range_rate[0], 0)
+        self.assertGreater(pass_data.range_rate[-1], 0)
+        self.assertGreater(pass_data.doppler_hz[0], 0)
+        self.assertLess(pass_data.doppler_hz[-1], 0)
+        # LEO range rate stays below orbital velocity, ~10 kHz at 437 MHz
+        self.assertLess(np.max(np.abs(pass_data.range_rate)), 7.8)
+        np.testing.assert_allclose(pass_data.doppler(437e6), pass_data.doppler_hz)
+
+    def test_track_stream_matches_pass_points(self):
+        tle_line1 = "1 25544U 98067A   23345.67890123  .00012345  00000-0  12345-3 0  9999"
+        tle_line2 = "2 25544  51.6416 123.4567 0001234 123.4567 321.4567 15.54321098123456"
+
+        station = GroundStation(37.7749, -122.4194, 0)
+        predictor = PassPredictor(tle_line1, tle_line2)
+        start_time = datetime.datetime(2023, 12, 12, 12, 0, 0)
+
+        pass_data = predictor.get_next_pass(station, start_time, step_seconds=10, carrier_frequency=437e6)
+
+        # 10 Hz stream over the pass, generated in 5 s blocks
+        samples = list(predictor.track(
+            station, pass_data.aos, pass_data.los, rate_hz=10, block_seconds=5.0,
+            carrier_frequency=437e6
+        ))
+        expected_count = int((pass_data.los - pass_data.aos).total_seconds() * 10) + 1
+        self.assertEqual(len(samples), expected_count)
+        self.assertEqual(samples[1]["time"] - samples[0]["time"], datetime.timedelta(seconds=0.1))
+
+        # Every 100th sample coincides with a pass point
+        every_10s = samples[::100]
+        np.testing.assert_allclose([s["el"] for s in every_10s], pass_data.el, atol=1e-4)
+        np.testing.assert_allclose([s["az"] for s in every_10s], pass_data.az, atol=1e-4)
+        np.testing.assert_allclose([s["doppler_hz"] for s in every_10s], pass_data.doppler_hz, atol=1.0)
+
+        async def collect():
+            return [s async for s in predictor.atrack(
+                station, pass_data.aos, pass_data.aos + datetime.timedelta(seconds=2),
+                rate_hz=10, realtime=False
+            )]
+
+        async_samples = asyncio.run(collect())
+        self.assertEqual(len(async_samples), 21)
+        self.assertEqual(async_samples[-1]["el"], samples[20]["el"])
+
+    def test_short_passes_match_fine_grid(self):
+        # Epoch 2020-09-22; some low passes last less than the 2-3 min coarse step
+        iss = ("1 25544U 98067A   20266.50000000  .00001000  00000-0  26000-4 0  9990",
+               "2 25544  51.6440 240.0000 0001500  90.0000 270.0000 15.49000000240000")
+        noaa19 = ("1 33591U 09005A   20266.50000000  .00000050  00000-0  50000-4 0  9990",
+                  "2 33591  99.1900 240.0000 0014000  90.0000 270.0000 14.12400000600000")
+        start_time = datetime.datetime(2020, 9, 22)
+        end_time = start_time + datetime.timedelta(hours=48)
+        stations = [GroundStation(-33.9, 18.4, 0), GroundStation(51.5, 0.0, 0)]
+
+        shortest = np.inf
+        for tle in (iss, noaa19):
+            predictor = PassPredictor(*tle)
+            jd, fr = predictor.get_julian_date(start_time)
+            offsets = np.arange(0.0, 48 * 3600.0 + 1.0)
+            e, r, _ = predictor.satellite.sgp4_array(np.full(len(offsets), jd), fr + offsets / 86400.0)
+            for station in stations:
+                _, el, _ = station.compute_look_angles(r, None, jd=jd, fr=fr + offsets / 86400.0)
+                for min_elevation in (0.0, 10.0):
+                    # Reference: AOS/LOS on a 1 s grid, passes truncated to the window
+                    visible = el > min_elevation
+                    edges = np.diff(np.concatenate(([False], visible, [False])).astype(np.int8))
+                    aos = offsets[np.where(edges == 1)[0]]
+                    los = offsets[np.where(edges == -1)[0] - 1]
+                    shortest = min(shortest, np.min(los - aos))
+
+                    passes = predictor.get_passes(station, start_time, end_time, min_elevation=min_elevation)
+                    self.assertEqual(len(passes), len(aos))
+                    np.testing.assert_allclose(
+                        [(p.aos - start_time).total_seconds() for p in passes], aos, atol=1.0
+                    )
+                    np.testing.assert_allclose(
+                        [(p.los - start_time).total_seconds() for p in passes], los, atol=1.0
+                    )
+        self.assertLess(shortest, 120.0)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,80 @@
+import datetime
+import numpy as np
+from shannon.ground_station import GroundStation
+from shannon.orbits import ConstellationPredictor, PassPredictor, _coarse_grid
+from shannon.visibility import can_be_visible
+
+ISS = ("1 25544U 98067A   23345.67890123  .00012345  00000-0  12345-3 0  9999",
+       "2 25544  51.6416 123.4567 0001234 123.4567 321.4567 15.54321098123456")
+SSO = ("1 33591U 09005A   20265.56828552  .00000055  00000-0  57632-4 0  9995",
+       "2 33591  99.1989 123.6338 0013952 147.2885 212.9238 14.12351659595519")
+MEO = ("1 24876U 97035A   23345.50000000  .00000000  00000-0  00000-0 0  9990",
+       "2 24876  55.5000 100.0000 0050000  50.0000 310.0000  2.00560000190000")
+
+START = datetime.datetime(2023, 12, 12, 12, 0, 0)
+STATIONS = [
+    GroundStation(59.3498, 18.0707, 10),    # Stockholm
+    GroundStation(-33.8688, 151.2093, 50),  # Sydney
+    GroundStation(78.2232, 15.6267, 400),   # Svalbard
+    GroundStation(0.0, -50.0, 0),           # Equator
+]
+
+
+def test_inclination_rules_out_high_latitudes():
+    iss = PassPredictor(*ISS).satellite
+    assert can_be_visible(iss, STATIONS[0])
+    # 51.6 deg inclination plus a ~21 deg footprint never reaches Svalbard
+    assert not can_be_visible(iss, STATIONS[2])
+    predictor = PassPredictor(*ISS)
+    jd, fr, offsets, _ = _coarse_grid(START, 86400.0, predictor.coarse_step_seconds)
+    assert predictor._prefiltered_ephemeris(STATIONS[2], jd, fr, offsets, 0.0) is None
+    # Polar orbits are visible everywhere
+    assert can_be_visible(PassPredictor(*SSO).satellite, STATIONS[2])
+
+
+def test_prefiltered_passes_match_full_scan():
+    end = START + datetime.timedelta(days=2)
+    for tle in (ISS, SSO, MEO):
+        full = PassPredictor(*tle)
+        filtered = PassPredictor(*tle, prefilter=True)
+        for station in STATIONS:
+            expected = full.get_passes(station, START, end)
+            actual = filtered.get_passes(station, START, end)
+            assert len(actual) == len(expected)
+            for a, b in zip(actual, expected):
+                assert abs((a.aos - b.aos).total_seconds()) < 0.2
+                assert abs((a.los - b.los).total_seconds()) < 0.2
+                assert abs(a.max_el - b.max_el) < 0.1
+
+
+def test_prefilter_keeps_pass_nodes_and_skips_time():
+    predictor = PassPredictor(*ISS)
+    station = STATIONS[0]
+    duration = 86400.0
+    jd, fr, offsets, _ = _coarse_grid(START, duration, predictor.coarse_step_seconds)
+    keep, _ = predictor._prefiltered_ephemeris(station, jd, fr, offsets, 0.0)
+    passes = predictor.get_passes(station, START, START + datetime.timedelta(seconds=duration))
+
+    # The nodes bracketing every pass are kept, along with all nodes in between
+    assert passes
+    for p in passes:
+        aos = (p.aos - START).total_seconds()
+        los = (p.los - START).total_seconds()
+        first = np.searchsorted(offsets, aos, side="right") - 1
+        last = np.searchsorted(offsets, los)
+        assert keep[first:last + 1].all()
+
+    # Most of the day cannot contain a pass and is never propagated at the coarse step
+    assert keep.mean() < 0.6
+
+
+def test_constellation_prefilter_matches_full_scan():
+    tles = [ISS, SSO, MEO, SSO]
+    end = START + datetime.timedelta(hours=12)
+    for station in STATIONS:
+        full = ConstellationPredictor(tles, prefilter=False).get_passes(station, START, end)
+        filtered = ConstellationPredictor(tles, batch_size=2).get_passes(station, START, end)
+        for expected, actual in zip(full, filtered):
+            assert len(actual) == len(expected)
+            assert np.allclose([p.aos.timestamp() for p in actual], [p.aos.timestamp() for p in expected], atol=0.2, rtol=0)
+            assert np.allclose([p.max_el for p in actual], [p.max_el for p in expected], atol=0.1)